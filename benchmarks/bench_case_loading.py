@@ -0,0 +1,66 @@
+"""
+Compare CSV and Parquet load times for case files of increasing size.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_case_loading --rows 10000 1000000 10000000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+import trust_core as tc
+from benchmarks.synthetic_cases import make_cases
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(rows: int, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "cases.csv")
+        make_cases(rows).to_csv(csv_path, index=False)
+
+        start = time.perf_counter()
+        sidecar = tc.ensure_columnar(csv_path)
+        convert_s = time.perf_counter() - start
+        if sidecar is None:
+            raise SystemExit("pyarrow is required for the columnar benchmark")
+
+        return {
+            "rows": rows,
+            "csv_mb": os.path.getsize(csv_path) / 1e6,
+            "parquet_mb": os.path.getsize(sidecar) / 1e6,
+            "convert_s": convert_s,
+            "csv_all_s": _best_of(lambda: pd.read_csv(csv_path, dtype=tc.CASE_DTYPES), repeat),
+            "parquet_all_s": _best_of(lambda: pd.read_parquet(sidecar), repeat),
+            "parquet_demo_s": _best_of(lambda: pd.read_parquet(sidecar, columns=list(tc.DEMO_COLUMNS)), repeat),
+            "parquet_fairness_s": _best_of(lambda: pd.read_parquet(sidecar, columns=list(tc.FAIRNESS_COLUMNS)), repeat),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = pd.DataFrame([run(rows, args.repeat) for rows in args.rows])
+    results["speedup_all"] = results["csv_all_s"] / results["parquet_all_s"]
+    results["speedup_demo"] = results["csv_all_s"] / results["parquet_demo_s"]
+    print(results.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+
+
+if __name__ == "__main__":
+    main()
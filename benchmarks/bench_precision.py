@@ -0,0 +1,69 @@
+"""
+Compare float64 and float32 scoring: time, peak memory and output size.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_precision --rows 1000000 10000000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import pandas as pd
+
+import trust_core as tc
+from benchmarks.synthetic_cases import make_cases
+
+
+def _score(cases: pd.DataFrame, s: tc.Safeguards, precision: str) -> pd.DataFrame:
+    scored = tc.simulate_model_outputs(cases, seed=7, precision=precision)
+    return tc.risk_columns(scored, s, precision).join(scored[list(tc.PREDICTION_COLUMNS)])
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(rows: int, precision: str, repeat: int) -> dict:
+    dtypes = {name: dtype for name, dtype in tc.CASE_DTYPES.items() if name != "eligible_true"}
+    cases = make_cases(rows).astype(dtypes)
+    s = tc.Safeguards()
+
+    gc.collect()
+    tracemalloc.start()
+    outputs = _score(cases, s, precision)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "rows": rows,
+        "precision": precision,
+        "score_s": _best_of(lambda: _score(cases, s, precision), repeat),
+        "peak_mb": peak / 1e6,
+        "outputs_mb": outputs.memory_usage(index=False, deep=True).sum() / 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = pd.DataFrame([run(rows, precision, args.repeat) for rows in args.rows for precision in tc.PRECISIONS])
+    base = results.groupby("rows")[["score_s", "peak_mb", "outputs_mb"]].transform("first")
+    results["speedup"] = base["score_s"] / results["score_s"]
+    results["peak_saving"] = 1 - results["peak_mb"] / base["peak_mb"]
+    results["memory_saving"] = 1 - results["outputs_mb"] / base["outputs_mb"]
+    print(results.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+
+
+if __name__ == "__main__":
+    main()
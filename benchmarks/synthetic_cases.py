@@ -0,0 +1,29 @@
+"""Synthetic case generator shaped like data/sample_cases.csv, for benchmarks."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+SECTORS = ["Transport", "Public Services", "Industry", "Health", "Energy"]
+REGIONS = ["North", "East", "South", "West"]
+GROUPS = ["Group A", "Group B"]
+
+
+def make_cases(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """Return `n_rows` random cases with the same columns as the sample file."""
+    rng = np.random.default_rng(seed)
+    need = np.round(rng.uniform(0.05, 0.95, n_rows), 3)
+    return pd.DataFrame(
+        {
+            "case_id": np.char.add("C", np.arange(1, n_rows + 1).astype(str)),
+            "sector": rng.choice(SECTORS, n_rows),
+            "region": rng.choice(REGIONS, n_rows),
+            "data_age_days": rng.integers(1, 180, n_rows),
+            "missing_rate": np.round(rng.beta(1.2, 14.0, n_rows), 3),
+            "ood_score": np.round(rng.beta(2.5, 4.0, n_rows), 3),
+            "sensitive_group": rng.choice(GROUPS, n_rows),
+            "need_score": need,
+            "eligible_true": (need + rng.normal(0, 0.1, n_rows) > 0.5).astype(int),
+        }
+    )
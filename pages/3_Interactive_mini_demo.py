@@ -1,20 +1,28 @@
 import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
 
 from trust_utils import (
+    CONF_THRESHOLD_SLIDER,
+    DEMO_COLUMNS,
+    FairnessCube,
+    MAX_DATA_AGE_SLIDER,
+    OOD_THRESHOLD_SLIDER,
+    PREDICTION_COLUMNS,
+    RISK_LEVELS,
     Safeguards,
-    add_risk_columns,
     case_risk,
+    fairness_figure,
     material_icon,
-    overall_summary,
+    open_case_store,
+    reliability_figure,
     render_callout,
     render_page_header,
     render_section_intro,
+    risk_columns,
+    risk_counts_figure,
+    safe_zone_figure,
     setup_page,
-    simulate_model_outputs,
 )
 
 
@@ -36,8 +44,8 @@ render_callout(
     accent="#1d4ed8",
 )
 
-df = pd.read_csv("data/sample_cases.csv")
-dfm = simulate_model_outputs(df)
+# Shared across sessions; this session only keeps its cohort selection.
+store = open_case_store()
 
 render_section_intro(
     title="1. Pick a case",
@@ -47,17 +55,19 @@ render_section_intro(
 
 filter_a, filter_b, filter_c = st.columns([1, 1, 1.2], gap="large")
 with filter_a:
-    sector = st.selectbox("Sector", sorted(dfm["sector"].unique()))
+    sector = st.selectbox("Sector", store.categories("sector"))
 with filter_b:
-    region = st.selectbox("Region", sorted(dfm["region"].unique()))
+    region = st.selectbox("Region", store.categories("region"))
 
-df_f = dfm[(dfm["sector"] == sector) & (dfm["region"] == region)].copy()
+df_f = store.frame(DEMO_COLUMNS + PREDICTION_COLUMNS, rows=store.rows(sector=sector, region=region))
 if df_f.empty:
     st.warning("No cases found for this filter in the demo data. Try another sector or region.")
     st.stop()
 
-default_order = add_risk_columns(df_f, Safeguards()).sort_values(
-    by=["risk_points", "confidence"], ascending=[False, True]
+default_order = (
+    risk_columns(df_f, Safeguards())[["risk_points"]]
+    .assign(case_id=df_f["case_id"], confidence=df_f["confidence"])
+    .sort_values(by=["risk_points", "confidence"], ascending=[False, True])
 )
 case_options = default_order["case_id"].tolist()
 with filter_c:
@@ -143,9 +153,12 @@ with control_left:
         """,
         unsafe_allow_html=True,
     )
-    conf_thr = st.slider("Confidence threshold", 0.40, 0.90, 0.65, 0.01)
-    ood_thr = st.slider("Out-of-context threshold", 0.10, 0.90, 0.45, 0.01)
-    max_age = st.slider("Maximum data age (days)", 30, 120, 60, 5)
+    conf_lo, conf_hi, conf_step = CONF_THRESHOLD_SLIDER
+    ood_lo, ood_hi, ood_step = OOD_THRESHOLD_SLIDER
+    age_lo, age_hi, age_step = MAX_DATA_AGE_SLIDER
+    conf_thr = st.slider("Confidence threshold", conf_lo, conf_hi, 0.65, conf_step)
+    ood_thr = st.slider("Out-of-context threshold", ood_lo, ood_hi, 0.45, ood_step)
+    max_age = st.slider("Maximum data age (days)", age_lo, age_hi, 60, age_step)
     human_review = st.toggle("Route low-confidence cases to human review", value=True)
     data_checks = st.toggle("Use data-quality checks", value=True)
 
@@ -246,50 +259,27 @@ render_section_intro(
     icon_name="bar_chart",
 )
 
-unsafe_df = add_risk_columns(df_f, unsafe_s)
-safe_df = add_risk_columns(df_f, safe_s)
-unsafe_summary = overall_summary(unsafe_df, unsafe_s)
-safe_summary = overall_summary(safe_df, safe_s)
+# Precomputed risk cube lookups (or the cohort's threshold index); no per-case scan.
+unsafe_summary = store.cohort_summary(unsafe_s, sector=sector, region=region)
+safe_summary = store.cohort_summary(safe_s, sector=sector, region=region)
 
 summary_a, summary_b, summary_c, summary_d = st.columns(4, gap="small")
 with summary_a:
-    st.metric("Unsafe: risky cases", int((unsafe_df["risk_level"] != "GREEN").sum()))
+    st.metric("Unsafe: risky cases", unsafe_summary["yellow_cases"] + unsafe_summary["red_cases"])
 with summary_b:
-    st.metric("Safeguarded: risky cases", int((safe_df["risk_level"] != "GREEN").sum()))
+    st.metric("Safeguarded: risky cases", safe_summary["yellow_cases"] + safe_summary["red_cases"])
 with summary_c:
-    st.metric("Safeguarded: review cases", int(safe_df["needs_review"].sum()))
+    st.metric("Safeguarded: review cases", safe_summary["review_cases"])
 with summary_d:
     st.metric("Fairness gap (demo)", f"{(safe_summary['bias_gap'] or 0):.2f}")
 
-risk_counts = pd.concat(
-    [
-        unsafe_df["risk_level"].value_counts().rename("count").reset_index().assign(mode="Without safeguards"),
-        safe_df["risk_level"].value_counts().rename("count").reset_index().assign(mode="With safeguards"),
-    ],
-    ignore_index=True,
+# Figures are cached on the values they show, so unchanged charts are not
+# rebuilt; Streamlit still sends every chart on a full rerun.
+risk_counts = tuple(
+    (mode, tuple(summary[f"{level.lower()}_cases"] for level in RISK_LEVELS))
+    for mode, summary in (("Without safeguards", unsafe_summary), ("With safeguards", safe_summary))
 )
-risk_counts.rename(columns={"index": "risk_level"}, inplace=True)
-risk_counts["risk_level"] = pd.Categorical(risk_counts["risk_level"], categories=["GREEN", "YELLOW", "RED"], ordered=True)
-risk_counts = risk_counts.sort_values(["mode", "risk_level"])
-
-fig_counts = px.bar(
-    risk_counts,
-    x="risk_level",
-    y="count",
-    color="mode",
-    barmode="group",
-    color_discrete_map={"Without safeguards": "#f59e0b", "With safeguards": "#0f766e"},
-    labels={"risk_level": "Risk level", "count": "Number of cases", "mode": ""},
-)
-fig_counts.update_layout(
-    paper_bgcolor="rgba(255,255,255,0)",
-    plot_bgcolor="rgba(255,255,255,0)",
-    font=dict(color="#334155"),
-    margin=dict(l=10, r=10, t=20, b=10),
-    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
-    yaxis=dict(gridcolor="#e2e8f0"),
-)
-st.plotly_chart(fig_counts, use_container_width=True)
+st.plotly_chart(risk_counts_figure(risk_counts), use_container_width=True)
 
 st.markdown("<hr>", unsafe_allow_html=True)
 
@@ -315,80 +305,46 @@ if not reasons:
 
 tabs = st.tabs(["Reliable", "Safe", "Fair", "Transparent", "Accountable"])
 
-with tabs[0]:
-    st.markdown("**Reliable means the same case should not flip unpredictably.**")
+
+@st.fragment
+def reliability_demo(pred_prob: float) -> None:
+    # A fragment: moving the instability slider reruns and resends only this
+    # chart, not the rest of the page.
     instability = st.slider("Instability (demo)", 0.00, 0.80, 0.20, 0.01, key="demo_reliability")
     runs = 16
     rng = np.random.default_rng(123)
-    probs = np.clip(float(row["pred_prob"]) + rng.normal(0, instability, size=runs), 0, 1)
+    probs = np.clip(pred_prob + rng.normal(0, instability, size=runs), 0, 1)
     labels = (probs >= 0.5).astype(int)
     stable_rate = float(np.mean(labels == labels[0]))
-    reliability_df = pd.DataFrame({"Run": np.arange(1, runs + 1), "Probability": probs})
-    fig_rel = px.line(reliability_df, x="Run", y="Probability", markers=True)
-    fig_rel.add_hline(y=0.5, line_dash="dash", line_color="#64748b")
-    fig_rel.update_layout(
-        paper_bgcolor="rgba(255,255,255,0)",
-        plot_bgcolor="rgba(255,255,255,0)",
-        font=dict(color="#334155"),
-        margin=dict(l=10, r=10, t=20, b=10),
-        yaxis=dict(range=[0, 1], gridcolor="#e2e8f0"),
-    )
-    st.plotly_chart(fig_rel, use_container_width=True)
+    st.plotly_chart(reliability_figure(tuple(probs.tolist())), use_container_width=True)
     st.info(f"Stability rate in this demo: {stable_rate:.2f}. The closer this stays to 1.00, the easier the system is to trust operationally.")
 
+
+with tabs[0]:
+    st.markdown("**Reliable means the same case should not flip unpredictably.**")
+    reliability_demo(float(row["pred_prob"]))
+
 with tabs[1]:
     st.markdown("**Safe means uncertain or unusual cases are slowed down before they can cause harm.**")
     safe_low_conf = float(row["confidence"]) < safe_s.conf_threshold
     safe_out_ctx = float(row["ood_score"]) > safe_s.ood_threshold
-    fig_safe = go.Figure()
-    fig_safe.add_shape(type="rect", x0=0, y0=safe_s.conf_threshold, x1=safe_s.ood_threshold, y1=1, fillcolor="rgba(34,197,94,0.08)", line_width=0)
-    fig_safe.add_shape(type="rect", x0=safe_s.ood_threshold, y0=0, x1=1, y1=safe_s.conf_threshold, fillcolor="rgba(239,68,68,0.10)", line_width=0)
-    fig_safe.add_vline(x=safe_s.ood_threshold, line_dash="dash", line_color="#f59e0b")
-    fig_safe.add_hline(y=safe_s.conf_threshold, line_dash="dash", line_color="#f59e0b")
-    fig_safe.add_trace(
-        go.Scatter(
-            x=[float(row["ood_score"])],
-            y=[float(row["confidence"])],
-            mode="markers+text",
-            marker=dict(size=18, color="#ef4444" if (safe_low_conf or safe_out_ctx) else "#16a34a", symbol="star"),
-            text=[row["case_id"]],
-            textposition="top center",
-            name="Selected case",
-        )
-    )
-    fig_safe.update_layout(
-        paper_bgcolor="rgba(255,255,255,0)",
-        plot_bgcolor="rgba(255,255,255,0)",
-        font=dict(color="#334155"),
-        margin=dict(l=10, r=10, t=20, b=10),
-        xaxis=dict(title="Out-of-context score", range=[0, 1], gridcolor="#e2e8f0"),
-        yaxis=dict(title="Confidence", range=[0, 1], gridcolor="#e2e8f0"),
+    fig_safe = safe_zone_figure(
+        float(row["ood_score"]),
+        float(row["confidence"]),
+        row["case_id"],
+        safe_s.ood_threshold,
+        safe_s.conf_threshold,
+        safe_low_conf or safe_out_ctx,
     )
     st.plotly_chart(fig_safe, use_container_width=True)
     st.info("If the point sits in the riskier area, the safe response is to pause, review, or investigate rather than automate.")
 
 with tabs[2]:
     st.markdown("**Fair means checking whether outcomes differ across groups and investigating gaps.**")
-    fairness_rates = df_f.groupby("sensitive_group")["pred_label"].mean().reset_index(name="positive_rate")
-    fairness_gap = float(fairness_rates["positive_rate"].max() - fairness_rates["positive_rate"].min()) if len(fairness_rates) > 1 else 0.0
-    fig_fair = px.bar(
-        fairness_rates,
-        x="sensitive_group",
-        y="positive_rate",
-        color="sensitive_group",
-        text=fairness_rates["positive_rate"].apply(lambda v: f"{v:.0%}"),
-        color_discrete_sequence=["#3b82f6", "#a855f7"],
-    )
-    fig_fair.update_traces(textposition="outside")
-    fig_fair.update_layout(
-        paper_bgcolor="rgba(255,255,255,0)",
-        plot_bgcolor="rgba(255,255,255,0)",
-        font=dict(color="#334155"),
-        margin=dict(l=10, r=10, t=20, b=10),
-        showlegend=False,
-        yaxis=dict(range=[0, 1.2], gridcolor="#e2e8f0", title="Positive rate"),
-        xaxis=dict(title=""),
-    )
+    fairness = FairnessCube.from_frame(df_f, ("sensitive_group",))
+    fairness_rates = fairness.rates(("sensitive_group",))
+    fairness_gap = float(fairness.gaps(("sensitive_group",))["gap"].iloc[0])
+    fig_fair = fairness_figure(tuple(zip(fairness_rates["sensitive_group"].tolist(), fairness_rates["positive_rate"].tolist())))
     st.plotly_chart(fig_fair, use_container_width=True)
     st.info(f"Current demo fairness gap: {fairness_gap:.2f}. A gap is a prompt to investigate, not proof by itself.")
 
@@ -0,0 +1,280 @@
+"""
+Rebuild the self-hosted web fonts used by the app.
+
+Scans the app sources for Material Symbols icon names, builds a Material
+Symbols Rounded subset holding only those glyphs plus the Inter weights the
+stylesheet uses, and writes the files to static/fonts/ with matching
+@font-face rules in assets/fonts.css. Commit both; rerun it whenever a page
+starts using a new icon. By default the fonts come from Google Fonts; with
+--offline they are subset locally with fontTools (pip install fonttools
+brotli) from the Material Symbols font bundled with Streamlit and an Inter
+variable font file:
+
+    python scripts/build_fonts.py
+    python scripts/build_fonts.py --offline --text-font path/to/Inter.ttf
+    python scripts/build_fonts.py --list   # only print the icons found
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import glob
+import hashlib
+import os
+import re
+import urllib.request
+from typing import Dict, Iterator, List, Optional, Sequence
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCES = ("app.py", "trust_utils.py", "pages/*.py")
+FONTS_DIR = os.path.join(ROOT, "static", "fonts")
+FONTS_CSS = os.path.join(ROOT, "assets", "fonts.css")
+
+CODEPOINTS_URL = (
+    "https://raw.githubusercontent.com/google/material-design-icons/master/"
+    "variablefont/MaterialSymbolsRounded%5BFILL%2CGRAD%2Copsz%2Cwght%5D.codepoints"
+)
+ICONS_CSS_URL = (
+    "https://fonts.googleapis.com/css2?family=Material+Symbols+Rounded:opsz,wght,FILL,GRAD@20..48,400,0,0"
+    "&icon_names={names}&display=block"
+)
+INTER_CSS_URL = "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap"
+# Unicode subsets of Inter worth shipping for this app's copy.
+INTER_SUBSETS = ("latin", "latin-ext")
+# The same subsets as code point ranges, for --offline builds.
+INTER_UNICODE_RANGE = "U+0000-024F, U+0259, U+02BB-02BC, U+02C6, U+02DA, U+02DC, U+1E00-1EFF, U+2000-206F, U+20A0-20CF, U+2113, U+2122, U+2190-2199, U+2212, U+2215, U+FEFF, U+FFFD"
+# Weight range the stylesheet uses.
+INTER_WEIGHTS = (400, 800)
+# The subset gets its own family name: declaring it as 'Material Symbols
+# Rounded' would replace the full face Streamlit draws its own icons with.
+ICONS_FAMILY = "Material Symbols Rounded Subset"
+# Google Fonts only serves woff2 to browsers that announce support for it.
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+
+_NAME = re.compile(r"^[a-z][a-z0-9_]*$")
+_ICON_SPAN = re.compile(r"material-symbols-rounded[^>]*>\s*([a-z][a-z0-9_]*)\s*<")
+_FONT_FACE = re.compile(r"(?:/\*\s*([\w-]+)\s*\*/\s*)?(@font-face\s*\{[^}]*\})")
+_URL = re.compile(r"url\(([^)]+)\)")
+
+
+def _fetch(url: str) -> bytes:
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+def _source_files() -> List[str]:
+    return sorted(path for pattern in SOURCES for path in glob.glob(os.path.join(ROOT, pattern)))
+
+
+def _string_literals(path: str) -> Iterator[str]:
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            yield node.value
+
+
+def icon_candidates(paths: Sequence[str]) -> set:
+    """Every string that could name an icon: bare identifiers and span contents."""
+    found = set()
+    for path in paths:
+        for text in _string_literals(path):
+            if _NAME.match(text):
+                found.add(text)
+            found.update(_ICON_SPAN.findall(text))
+    return found
+
+
+def used_icons(paths: Sequence[str]) -> List[str]:
+    """Icon names used by the app, sorted as the Google Fonts API requires."""
+    known = {line.split()[0] for line in _fetch(CODEPOINTS_URL).decode().splitlines() if line.strip()}
+    return sorted(icon_candidates(paths) & known)
+
+
+def _localize(css: str, prefix: str, subsets: Sequence[str] = ()) -> tuple:
+    # Keep the wanted @font-face rules, download their files and point the
+    # rules at the local copies. Returns (css, {filename: bytes}).
+    rules, files, downloaded = [], {}, {}
+    for subset, rule in _FONT_FACE.findall(css):
+        if subsets and subset not in subsets:
+            continue
+        url = _URL.search(rule).group(1).strip("'\"")
+        if url not in downloaded:
+            data = _fetch(url)
+            name = f"{prefix}-{hashlib.sha1(data).hexdigest()[:12]}.woff2"
+            downloaded[url] = name
+            files[name] = data
+        label = f"/* {prefix} {subset} */\n" if subset else f"/* {prefix} */\n"
+        rules.append(label + _URL.sub(f"url(fonts/{downloaded[url]})", rule, count=1))
+    return "\n".join(rules), files
+
+
+def bundled_icon_font() -> Optional[str]:
+    """The Material Symbols Rounded font shipped with Streamlit, if installed."""
+    try:
+        import streamlit
+    except ImportError:
+        return None
+    media = os.path.join(os.path.dirname(streamlit.__file__), "static", "static", "media")
+    found = sorted(glob.glob(os.path.join(media, "MaterialSymbols-Rounded*.woff2")))
+    return found[0] if found else None
+
+
+def _ligatures(font) -> Dict[str, str]:
+    # Icon name -> glyph name, read from the font's ligature substitutions.
+    chars = {glyph: chr(code) for code, glyph in font.getBestCmap().items()}
+    names = {}
+    for lookup in font["GSUB"].table.LookupList.Lookup:
+        for table in lookup.SubTable:
+            table = getattr(table, "ExtSubTable", table)
+            if table.LookupType != 4:
+                continue
+            for first, ligatures in table.ligatures.items():
+                for ligature in ligatures:
+                    components = [first, *ligature.Component]
+                    if all(glyph in chars for glyph in components):
+                        names["".join(chars[glyph] for glyph in components)] = ligature.LigGlyph
+    return names
+
+
+def local_icons(path: str, paths: Sequence[str]) -> List[str]:
+    """Icon names used by the app that the local icon font can draw."""
+    from fontTools.ttLib import TTFont
+
+    return sorted(icon_candidates(paths) & set(_ligatures(TTFont(path))))
+
+
+def _woff2(font) -> bytes:
+    # Fonts are opened with recalcTimestamp=False so rebuilds are byte-identical.
+    import io
+
+    font.flavor = "woff2"
+    buffer = io.BytesIO()
+    font.save(buffer)
+    return buffer.getvalue()
+
+
+def _subset_icons(path: str, icons: Sequence[str]) -> bytes:
+    # Keep only the ligatures (and glyphs) of `icons`; without pruning, the
+    # subsetter's closure would keep every icon spelled with the same letters.
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(path, recalcTimestamp=False)
+    wanted = {_ligatures(font)[name] for name in icons}
+    for lookup in font["GSUB"].table.LookupList.Lookup:
+        for table in lookup.SubTable:
+            table = getattr(table, "ExtSubTable", table)
+            if table.LookupType == 4:
+                table.ligatures = {
+                    first: kept
+                    for first, ligatures in table.ligatures.items()
+                    if (kept := [ligature for ligature in ligatures if ligature.LigGlyph in wanted])
+                }
+    options = subset.Options()
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(glyphs=sorted(wanted), unicodes=sorted({ord(char) for name in icons for char in name}))
+    subsetter.subset(font)
+    return _woff2(font)
+
+
+def _unicodes(ranges: str) -> List[int]:
+    codes = []
+    for part in ranges.split(","):
+        start, _, stop = part.strip()[2:].partition("-")
+        codes.extend(range(int(start, 16), int(stop or start, 16) + 1))
+    return codes
+
+
+def _subset_text(path: str) -> bytes:
+    # Upright Inter limited to the stylesheet's weight range and unicode subsets.
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+
+    font = TTFont(path, recalcTimestamp=False)
+    options = subset.Options()
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=_unicodes(INTER_UNICODE_RANGE))
+    subsetter.subset(font)
+    if "fvar" in font:
+        axes = {axis.axisTag for axis in font["fvar"].axes}
+        limits = {"wght": INTER_WEIGHTS, **{tag: 0 for tag in axes - {"wght"}}}
+        font = instancer.instantiateVariableFont(font, limits)
+    return _woff2(font)
+
+
+def _font_face(family: str, prefix: str, data: bytes, weight: str, display: str, unicode_range: str = "") -> tuple:
+    name = f"{prefix}-{hashlib.sha1(data).hexdigest()[:12]}.woff2"
+    rule = (
+        f"/* {prefix} */\n@font-face {{\n  font-family: '{family}';\n  font-style: normal;\n"
+        f"  font-weight: {weight};\n  font-display: {display};\n  src: url(fonts/{name}) format('woff2');\n"
+        + (f"  unicode-range: {unicode_range};\n" if unicode_range else "")
+        + "}"
+    )
+    return rule, {name: data}
+
+
+def build_offline(icons: Sequence[str], icons_font: str, text_font: str) -> Dict[str, int]:
+    """Subset local font files and write static/fonts/ and assets/fonts.css."""
+    icons_css, icon_files = _font_face(ICONS_FAMILY, "material-symbols-rounded", _subset_icons(icons_font, icons), "400", "block")
+    weights = f"{INTER_WEIGHTS[0]} {INTER_WEIGHTS[1]}"
+    inter_css, inter_files = _font_face("Inter", "inter", _subset_text(text_font), weights, "swap", INTER_UNICODE_RANGE)
+    return _write(icons, icons_css + "\n" + inter_css, {**icon_files, **inter_files})
+
+
+def build(icons: Sequence[str]) -> Dict[str, int]:
+    """Download the fonts and write static/fonts/ and assets/fonts.css."""
+    icons_css, icon_files = _localize(_fetch(ICONS_CSS_URL.format(names=",".join(icons))).decode(), "material-symbols-rounded")
+    icons_css = icons_css.replace("'Material Symbols Rounded'", f"'{ICONS_FAMILY}'")
+    inter_css, inter_files = _localize(_fetch(INTER_CSS_URL).decode(), "inter", INTER_SUBSETS)
+    return _write(icons, icons_css + "\n" + inter_css, {**icon_files, **inter_files})
+
+
+def _write(icons: Sequence[str], css: str, files: Dict[str, bytes]) -> Dict[str, int]:
+    # Replace static/fonts/*.woff2 with `files` and write assets/fonts.css.
+    os.makedirs(FONTS_DIR, exist_ok=True)
+    for name in os.listdir(FONTS_DIR):
+        if name.endswith(".woff2") and name not in files:
+            os.remove(os.path.join(FONTS_DIR, name))
+    for name, data in files.items():
+        with open(os.path.join(FONTS_DIR, name), "wb") as f:
+            f.write(data)
+
+    header = (
+        "/* Generated by scripts/build_fonts.py - do not edit by hand.\n"
+        f"   Material Symbols subset: {', '.join(icons)}\n"
+        "   Material Symbols: Apache License 2.0. Inter: SIL Open Font License 1.1. */\n"
+    )
+    with open(FONTS_CSS, "w", encoding="utf-8") as f:
+        f.write(header + css + "\n")
+    return {name: len(data) for name, data in files.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--list", action="store_true", help="print the icon names found and exit")
+    parser.add_argument("--offline", action="store_true", help="subset local font files instead of downloading")
+    parser.add_argument("--icons-font", default=bundled_icon_font(), help="Material Symbols Rounded font for --offline (default: Streamlit's)")
+    parser.add_argument("--text-font", help="Inter font file (variable .ttf) for --offline")
+    args = parser.parse_args()
+
+    if args.offline and not (args.icons_font and args.text_font):
+        parser.error("--offline needs --text-font, and --icons-font when Streamlit is not installed")
+    icons = local_icons(args.icons_font, _source_files()) if args.offline else used_icons(_source_files())
+    print(f"{len(icons)} icons: {', '.join(icons)}")
+    if args.list:
+        return
+    sizes = build_offline(icons, args.icons_font, args.text_font) if args.offline else build(icons)
+    for name, size in sorted(sizes.items()):
+        print(f"  static/fonts/{name}  {size / 1024:.1f} KB")
+    print(f"Wrote {os.path.relpath(FONTS_CSS, ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Checks for the trust_core engine and its command line."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import trust_core as tc
+
+# Known-answer vectors for Philox4x32-10 from the Random123 distribution (kat_vectors).
+PHILOX_KAT = [
+    ((0x00000000, 0x00000000, 0x00000000, 0x00000000), (0x00000000, 0x00000000),
+     (0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8)),
+    ((0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF), (0xFFFFFFFF, 0xFFFFFFFF),
+     (0x408F276D, 0x41C83B0E, 0xA20BC7C6, 0x6D5451FD)),
+    ((0x243F6A88, 0x85A308D3, 0x13198A2E, 0x03707344), (0xA4093822, 0x299F31D0),
+     (0xD16CFE09, 0x94FDCCEB, 0x5001E420, 0x24126EA1)),
+]
+
+
+@pytest.mark.parametrize("counter, key, expected", PHILOX_KAT)
+def test_philox4x32_known_answers(counter, key, expected):
+    words = tc.philox4x32([np.array([c], dtype=np.uint64) for c in counter], key)
+    assert tuple(int(w[0]) for w in words) == expected
+
+
+def test_philox4x32_vectorized_matches_scalar():
+    counters = [np.array([v[0][i] for v in PHILOX_KAT], dtype=np.uint64) for i in range(4)]
+    words = tc.philox4x32(counters, (0x12345678, 0x9ABCDEF0))
+    for j in range(len(PHILOX_KAT)):
+        single = tc.philox4x32([c[j : j + 1] for c in counters], (0x12345678, 0x9ABCDEF0))
+        assert [int(w[j]) for w in words] == [int(w[0]) for w in single]
+
+
+def test_case_noise_ignores_subset_and_order():
+    cases = pd.DataFrame({"case_id": [f"C{i}" for i in range(1000)]})
+    full = pd.DataFrame(dict(zip(("a", "b"), tc.case_noise(cases, seed=11))), index=cases["case_id"])
+    subset = cases.sample(frac=0.3, random_state=0).reset_index(drop=True)
+    part = pd.DataFrame(dict(zip(("a", "b"), tc.case_noise(subset, seed=11))), index=subset["case_id"])
+    pd.testing.assert_frame_equal(part, full.loc[subset["case_id"]])
+    assert not np.allclose(tc.case_noise(cases, seed=12)[0], full["a"])
+
+
+def test_simulated_outputs_do_not_depend_on_chunking():
+    cases = tc.load_cases()
+    whole = tc.simulate_model_outputs(cases, seed=7)
+    chunks = pd.concat([tc.simulate_model_outputs(cases.iloc[i : i + 37], seed=7) for i in range(0, len(cases), 37)])
+    pd.testing.assert_frame_equal(chunks, whole)
+
+
+def test_load_cases_edits_do_not_reach_the_cache():
+    cases = tc.load_cases()
+    expected = cases.copy()
+    try:
+        cases.loc[0, "need_score"] = 0.5
+        cases.loc[0, "sector"] = cases["sector"].cat.categories[-1]
+    except ValueError:  # numeric columns stay read-only without Copy-on-Write
+        pass
+    cases["pred_label"] = 1
+    pd.testing.assert_frame_equal(tc.load_cases(), expected)
+
+
+# Slider positions, then thresholds between or beyond the slider grids.
+ON_GRID = [
+    dict(conf_threshold=0.65, ood_threshold=0.45, max_data_age_days=60),
+    dict(conf_threshold=0.40, ood_threshold=0.90, max_data_age_days=120, data_quality_checks=False),
+    dict(conf_threshold=0.90, ood_threshold=0.10, max_data_age_days=30, human_review_low_conf=False, bias_check=False),
+]
+OFF_GRID = [
+    dict(conf_threshold=0.655, ood_threshold=0.452, max_data_age_days=62),
+    dict(conf_threshold=0.95, ood_threshold=0.05, max_data_age_days=130, confidence_threshold_on=False),
+]
+
+
+def _expected_counts(df, s):
+    risk = tc.risk_columns(df, s)
+    levels = risk["risk_level"].value_counts()
+    counts = {f"{level.lower()}_cases": int(levels.get(level, 0)) for level in tc.RISK_LEVELS}
+    return {**counts, "review_cases": int(risk["needs_review"].sum())}
+
+
+@pytest.fixture(scope="module")
+def scored_cases():
+    return tc.simulate_model_outputs(tc.load_cases(), seed=7)
+
+
+@pytest.mark.parametrize("fields", ON_GRID + OFF_GRID)
+def test_threshold_index_matches_full_scan(scored_cases, fields):
+    s = tc.Safeguards(**fields)
+    index = tc.ThresholdIndex(scored_cases)
+    assert index.summary(s) == tc.overall_summary(scored_cases, s)
+    assert index.risk_counts(s) == _expected_counts(scored_cases, s)
+
+
+@pytest.fixture(scope="module")
+def sector_cube(scored_cases, tmp_path_factory):
+    return tc.RiskCube(tc.build_risk_cube(scored_cases, str(tmp_path_factory.mktemp("cube") / "cube"), by=("sector",)))
+
+
+@pytest.mark.parametrize("fields", ON_GRID)
+def test_risk_cube_matches_full_scan(scored_cases, sector_cube, fields):
+    s = tc.Safeguards(**fields)
+    for sector, cohort in scored_cases.groupby("sector", observed=True):
+        assert sector_cube.lookup(s, sector=sector) == {**tc.overall_summary(cohort, s), **_expected_counts(cohort, s)}
+
+
+@pytest.mark.parametrize("fields", OFF_GRID)
+def test_risk_cube_misses_off_grid_thresholds(sector_cube, fields):
+    assert sector_cube.lookup(tc.Safeguards(**fields), sector="Transport") is None
+
+
+def test_risk_cube_misses_unknown_cohorts(sector_cube):
+    assert sector_cube.lookup(tc.Safeguards(), sector="Retail") is None
+    assert sector_cube.lookup(tc.Safeguards(), region="North") is None
+
+
+def test_score_portfolio_workers_match_serial(scored_cases):
+    configs = [tc.Safeguards(), tc.Safeguards(**OFF_GRID[0]), tc.Safeguards(**ON_GRID[2])]
+    serial = tc.score_portfolio(scored_cases, configs, workers=1)
+    parallel = tc.score_portfolio(scored_cases, configs, workers=2, partition_rows=7)
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+@pytest.mark.parametrize("out, summary", [("out.json", "summary.json"), ("out.csv", "summary.txt")])
+def test_score_cli_rejects_unknown_output_types(tmp_path, capsys, out, summary):
+    with pytest.raises(SystemExit) as exc:
+        tc.main(["score", tc.SAMPLE_CASES_PATH, "-o", str(tmp_path / out), "--summary", str(tmp_path / summary)])
+    assert exc.value.code == 2
+    assert "Cannot write" in capsys.readouterr().err
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("text", ['{"bias_check": "false"}', '{"conf_threshold": "0.7"}', '{"max_data_age_days": true}', "[]"])
+def test_load_safeguards_rejects_mistyped_settings(tmp_path, text):
+    path = tmp_path / "safeguards.json"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        tc.load_safeguards(str(path))
+
+
+def test_load_safeguards_reads_toml_table(tmp_path):
+    path = tmp_path / "safeguards.toml"
+    path.write_text("[safeguards]\nbias_check = false\nconf_threshold = 0.7\nmax_data_age_days = 90\n")
+    assert tc.load_safeguards(str(path)) == tc.Safeguards(bias_check=False, conf_threshold=0.7, max_data_age_days=90)
+
+
+def _edit(cases):
+    edited = cases.copy()
+    edited.loc[[3, 50, 70], "need_score"] += 0.2
+    edited.loc[9, "sensitive_group"] = "Group B" if edited.loc[9, "sensitive_group"] == "Group A" else "Group A"
+    return edited
+
+
+def _append(cases):
+    extra = cases.iloc[:15].assign(case_id=lambda d: "N" + d["case_id"].astype(str), ood_score=0.9)
+    return pd.concat([cases, extra], ignore_index=True)
+
+
+REFRESH_STEPS = [
+    pytest.param(lambda cases: cases, (0, 0, 0, 120), id="unchanged"),
+    pytest.param(_edit, (0, 4, 0, 116), id="edit"),
+    pytest.param(_append, (15, 0, 0, 120), id="append"),
+    pytest.param(lambda cases: cases.drop(index=[1, 2, 3, 60]), (0, 0, 4, 116), id="delete"),
+    pytest.param(lambda cases: cases.sample(frac=1, random_state=0), (0, 0, 0, 120), id="reorder"),
+]
+
+
+@pytest.mark.parametrize("change, expected", REFRESH_STEPS)
+def test_refresh_scores_matches_full_rescore(tmp_path, change, expected):
+    s = tc.Safeguards()
+    path = str(tmp_path / "cases.csv")
+    cases = pd.read_csv(tc.SAMPLE_CASES_PATH)
+    cases.to_csv(path, index=False)
+    tc.refresh_scores(path, s)
+
+    change(cases).to_csv(path, index=False)
+    result = tc.refresh_scores(path, s)
+    full = tc.refresh_scores(path, s, store_dir=str(tmp_path / "full.scores"))
+    assert (result.added, result.changed, result.removed, result.unchanged) == expected
+    assert result.accumulator.summary() == full.accumulator.summary()
+    assert result.accumulator.counts() == full.accumulator.counts()
+    pd.testing.assert_frame_equal(tc.load_scores(result.store_dir), tc.load_scores(full.store_dir))
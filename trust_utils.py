@@ -1,11 +1,73 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Any, Optional, Sequence
+import hashlib
+import os
+import re
+import tempfile
+from functools import lru_cache
+from typing import Optional, Sequence
 import numpy as np
 import pandas as pd
 import streamlit as st
 
+from trust_core import (  # noqa: F401 - re-exported for the pages
+    SAMPLE_CASES_PATH,
+    CASE_DTYPES,
+    SIMULATION_COLUMNS,
+    DEMO_COLUMNS,
+    FAIRNESS_COLUMNS,
+    columnar_path,
+    CHUNK_ROWS,
+    ensure_columnar,
+    iter_case_chunks,
+    load_cases,
+    PREDICTION_COLUMNS,
+    case_store_path,
+    CaseStore,
+    build_case_store,
+    open_case_store,
+    Safeguards,
+    sigmoid,
+    SIMULATION_VERSION,
+    simulate_model_outputs,
+    CACHE_DIR,
+    dataset_fingerprint,
+    simulate_model_outputs_cached,
+    GroupRates,
+    compute_bias_gap,
+    FairnessCube,
+    fairness_gaps,
+    RiskReason,
+    RISK_REASON_TEXT,
+    RISK_LEVELS,
+    risk_level_codes,
+    risk_level_categorical,
+    count_levels,
+    describe_reasons,
+    RiskScores,
+    risk_kernel,
+    case_risk,
+    RISK_COLUMNS,
+    risk_columns,
+    add_risk_columns,
+    overall_summary,
+    SummaryAccumulator,
+    stream_summary,
+    SafeguardsBatch,
+    score_safeguards_batch,
+    score_portfolio,
+    CONF_THRESHOLD_SLIDER,
+    OOD_THRESHOLD_SLIDER,
+    MAX_DATA_AGE_SLIDER,
+    slider_grid,
+    FLAG_PATTERNS,
+    THRESHOLD_INDEX_COLUMNS,
+    ThresholdIndex,
+    CUBE_TOGGLES,
+    build_risk_cube,
+    RiskCube,
+)
+
 
 PAGE_ICONS = {
     "home": ":material/robot_2:",
@@ -75,35 +137,81 @@ NAV_DETAILS = {
 }
 
 
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+# Served by Streamlit under app/static/ when server.enableStaticServing is on.
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+_CSS_STRING = re.compile(r"""("[^"]*"|'[^']*')""")
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and insignificant whitespace; quoted strings are kept as is."""
+    parts = _CSS_STRING.split(re.sub(r"/\*.*?\*/", "", css, flags=re.S))
+    for i in range(0, len(parts), 2):
+        text = re.sub(r"\s+", " ", parts[i])
+        text = re.sub(r"\s*([{};,>])\s*", r"\1", text)
+        parts[i] = re.sub(r":\s+", ":", text).replace(";}", "}")
+    return "".join(parts).strip()
+
+
+@lru_cache(maxsize=None)
+def _stylesheet(name: str) -> str:
+    # Minified CSS of an asset, read once per server process.
+    with open(os.path.join(ASSETS_DIR, name), encoding="utf-8") as f:
+        return minify_css(f.read())
+
+
+@lru_cache(maxsize=None)
+def _stylesheet_url(name: str) -> Optional[str]:
+    # Publish the minified asset under a content-hashed name, so browsers can
+    # keep it cached; None if the static folder is not writable.
+    css = _stylesheet(name)
+    stem, ext = os.path.splitext(name)
+    filename = f"{stem}.{hashlib.sha1(css.encode(), usedforsecurity=False).hexdigest()[:12]}{ext}"
+    target = os.path.join(STATIC_DIR, filename)
+    try:
+        if not os.path.exists(target):
+            os.makedirs(STATIC_DIR, exist_ok=True)
+            # Unique temporary name: sessions publishing at once never collide.
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=STATIC_DIR, suffix=".tmp", delete=False) as f:
+                f.write(css)
+            os.replace(f.name, target)
+    except OSError:
+        return None
+    return f"app/static/{filename}"
+
+
+def _inline_stylesheet(name: str) -> str:
+    # Inline CSS resolves url()s against the page, not app/static/.
+    return _stylesheet(name).replace("url(fonts/", "url(app/static/fonts/")
+
+
+def _serves_css() -> bool:
+    # Before 1.56 Streamlit sent static .css files as text/plain with
+    # nosniff, so browsers ignored <link>ed stylesheets.
+    version = tuple(int(part) for part in re.findall(r"\d+", st.__version__)[:2])
+    return version >= (1, 56) and bool(st.get_option("server.enableStaticServing"))
+
+
+def _inject_stylesheet(name: str) -> None:
+    # Reruns only resend a <link> to the hashed file; inline CSS is the
+    # fallback when Streamlit cannot serve it.
+    url = _stylesheet_url(name) if _serves_css() else None
+    if url:
+        st.markdown(f"<link rel='stylesheet' href='{url}'>", unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>{_inline_stylesheet(name)}</style>", unsafe_allow_html=True)
+
+
 def inject_icon_font() -> None:
     """Load Material Symbols for consistent icon rendering in custom HTML."""
-    st.markdown(
-        """
-        <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap');
-        @import url('https://fonts.googleapis.com/css2?family=Material+Symbols+Rounded:opsz,wght,FILL,GRAD@20..48,400,0,0');
-
-        .material-symbols-rounded {
-            font-family: 'Material Symbols Rounded';
-            font-weight: normal;
-            font-style: normal;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            -webkit-font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            font-variation-settings: 'FILL' 0, 'wght' 500, 'GRAD' 0, 'opsz' 24;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    # The fonts built by scripts/build_fonts.py are committed under
+    # static/fonts/; nothing is fetched from outside. Without static serving
+    # icons use the Material Symbols Rounded face Streamlit bundles, and text
+    # the system fonts after 'Inter' in app.css.
+    if st.get_option("server.enableStaticServing") and os.path.exists(os.path.join(ASSETS_DIR, "fonts.css")):
+        _inject_stylesheet("fonts.css")
+    _inject_stylesheet("icons.css")
 
 
 def material_icon(name: str, size: int = 24, color: str = "currentColor") -> str:
@@ -118,8 +226,11 @@ def _join_chips(chips: Sequence[str]) -> str:
     return "".join(f"<span class='chip'>{chip}</span>" for chip in chips)
 
 
-def render_sidebar(active_page: str) -> None:
-    """Render the shared story-first sidebar navigation."""
+@lru_cache(maxsize=None)
+def _sidebar_blocks(active_page: str) -> tuple:
+    # Everything the sidebar shows for one page, in order: ("html", markup)
+    # or ("link", (path, label, icon)). A pure function of active_page, so
+    # each page's markup is built once per server process.
     nav_lookup = {key: (path, label) for key, path, label in NAV_ITEMS}
     story_keys = [key for key, _, _ in NAV_ITEMS if key != "home"]
     total_steps = len(story_keys)
@@ -137,8 +248,9 @@ def render_sidebar(active_page: str) -> None:
         next_path, next_label = nav_lookup[next_key]
         next_item = (next_key, next_path, next_label)
 
-    with st.sidebar:
-        st.markdown(
+    blocks = [
+        (
+            "html",
             f"<div class='sidebar-hero'>"
             f"<div class='sidebar-eyebrow'>Navigator</div>"
             f"<div class='sidebar-title'>{material_icon('explore', 20, '#1d4ed8')} Trustworthy AI Explained</div>"
@@ -149,1767 +261,68 @@ def render_sidebar(active_page: str) -> None:
             f"</div>"
             f"<div class='sidebar-progress-track'><span style='width:{progress * 100:.0f}%;'></span></div>"
             f"</div>",
-            unsafe_allow_html=True,
         )
-
-        for group_title, group_keys in NAV_GROUPS:
-            st.markdown(f"<div class='sidebar-group-label'>{group_title}</div>", unsafe_allow_html=True)
-            for key in group_keys:
-                path, label = nav_lookup[key]
-                details = NAV_DETAILS.get(key, {})
-                step_copy = details.get("eyebrow", "Overview")
-                if key != "home":
-                    step_copy = f"{step_copy} of {total_steps}"
-                st.page_link(path, label=label, icon=PAGE_ICONS[key])
-                st.markdown(
-                    (
-                        f"<div class='sidebar-link-meta{' sidebar-link-meta-active' if key == active_page else ''}'>"
-                        f"<span class='sidebar-link-kicker'>{step_copy}</span>"
-                        f"<span>{details.get('summary', '')}</span>"
-                        f"</div>"
-                    ),
-                    unsafe_allow_html=True,
+    ]
+
+    for group_title, group_keys in NAV_GROUPS:
+        blocks.append(("html", f"<div class='sidebar-group-label'>{group_title}</div>"))
+        for key in group_keys:
+            path, label = nav_lookup[key]
+            details = NAV_DETAILS.get(key, {})
+            step_copy = details.get("eyebrow", "Overview")
+            if key != "home":
+                step_copy = f"{step_copy} of {total_steps}"
+            blocks.append(("link", (path, label, PAGE_ICONS[key])))
+            blocks.append(
+                (
+                    "html",
+                    f"<div class='sidebar-link-meta{' sidebar-link-meta-active' if key == active_page else ''}'>"
+                    f"<span class='sidebar-link-kicker'>{step_copy}</span>"
+                    f"<span>{details.get('summary', '')}</span>"
+                    f"</div>",
                 )
+            )
 
-        st.markdown(
+    blocks.append(
+        (
+            "html",
             f"<div class='sidebar-note'>"
             f"<div class='sidebar-note-title'>{material_icon('flag', 16, current_details.get('accent', '#0f172a'))} Current focus</div>"
             f"<div class='sidebar-note-copy'>{current_label}</div>"
             f"<div class='sidebar-note-subcopy'>{current_details.get('summary', 'Use the menu to move through the story.')}</div>"
             f"</div>",
-            unsafe_allow_html=True,
         )
-        if next_item:
-            next_key, next_path, next_label = next_item
-            st.markdown("<div class='sidebar-group-label'>Recommended next</div>", unsafe_allow_html=True)
-            st.markdown(
-                (
-                    "<div class='sidebar-link-meta sidebar-link-meta-next'>"
-                    f"<span class='sidebar-link-kicker'>{next_label}</span>"
-                    f"<span>{NAV_DETAILS[next_key]['eyebrow']}</span><br>"
-                    f"<span>{NAV_DETAILS[next_key]['summary']}</span>"
-                    "</div>"
-                ),
-                unsafe_allow_html=True,
+    )
+    if next_item:
+        next_key, next_path, next_label = next_item
+        blocks.append(("html", "<div class='sidebar-group-label'>Recommended next</div>"))
+        blocks.append(
+            (
+                "html",
+                "<div class='sidebar-link-meta sidebar-link-meta-next'>"
+                f"<span class='sidebar-link-kicker'>{next_label}</span>"
+                f"<span>{NAV_DETAILS[next_key]['eyebrow']}</span><br>"
+                f"<span>{NAV_DETAILS[next_key]['summary']}</span>"
+                "</div>",
             )
+        )
+    return tuple(blocks)
+
+
+def render_sidebar(active_page: str) -> None:
+    """Render the shared story-first sidebar navigation."""
+    with st.sidebar:
+        for kind, value in _sidebar_blocks(active_page):
+            if kind == "link":
+                path, label, icon = value
+                st.page_link(path, label=label, icon=icon)
+            else:
+                st.markdown(value, unsafe_allow_html=True)
 
 
 def inject_global_styles() -> None:
     """Inject the shared visual design system used across pages."""
-    st.markdown(
-        """
-        <style>
-        :root {
-            --bg: #f6f8fc;
-            --surface: rgba(255, 255, 255, 0.96);
-            --surface-strong: #ffffff;
-            --border: #d6deeb;
-            --text: #0f172a;
-            --muted: #475569;
-            --accent: #2563eb;
-            --shadow: 0 14px 34px rgba(15, 23, 42, 0.07);
-        }
-        .stApp {
-            background:
-                radial-gradient(circle at top left, rgba(37, 99, 235, 0.06), transparent 34%),
-                linear-gradient(180deg, #f6f8fc 0%, #ffffff 42%, #f8fafc 100%);
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        }
-        [data-testid="stAppViewContainer"] {
-            background: transparent;
-        }
-        [data-testid="stSidebarNav"],
-        section[data-testid="stSidebarNav"],
-        nav[data-testid="stSidebarNav"],
-        [data-testid="stSidebarNavItems"],
-        [data-testid="stSidebarNavSeparator"] {
-            display: none;
-        }
-        [data-testid="stSidebar"] {
-            background: linear-gradient(180deg, #f8fbff 0%, #f8fafc 100%);
-            border-right: 1px solid var(--border);
-        }
-        .block-container {
-            padding-top: 1.15rem;
-            padding-bottom: 3rem;
-            max-width: 1180px;
-        }
-        [data-testid="metric-container"] {
-            background: rgba(255, 255, 255, 0.95);
-            border: 1px solid var(--border);
-            border-radius: 14px;
-            padding: 13px;
-            box-shadow: 0 8px 20px rgba(15, 23, 42, 0.04);
-        }
-        h1, h2, h3 {
-            color: var(--text) !important;
-            letter-spacing: -0.02em;
-        }
-        p, li, div {
-            color: #111827;
-        }
-        details summary {
-            font-size: 1.02rem;
-            font-weight: 600;
-        }
-        .stAlert {
-            border-radius: 16px;
-        }
-        hr {
-            border-color: #e2e8f0;
-            margin: 1.15rem 0;
-        }
-        .hero-panel {
-            background: linear-gradient(180deg, rgba(255,255,255,0.97), rgba(248,250,252,0.95));
-            border: 1px solid var(--border);
-            border-radius: 20px;
-            padding: 20px 22px;
-            box-shadow: var(--shadow);
-            margin-bottom: 0.35rem;
-        }
-        .hero-row {
-            display: flex;
-            align-items: flex-start;
-            gap: 14px;
-        }
-        .hero-icon {
-            width: 52px;
-            height: 52px;
-            border-radius: 16px;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            background: rgba(37, 99, 235, 0.10);
-            flex-shrink: 0;
-        }
-        .muted {
-            color: var(--muted);
-            font-size: 1rem;
-            line-height: 1.6;
-        }
-        .hero-panel h1 {
-            line-height: 1.08;
-            margin-bottom: 0.35rem !important;
-        }
-        .hero-panel .muted {
-            max-width: 60rem;
-        }
-        .hero-kicker {
-            color: var(--muted);
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            font-size: 0.78rem;
-            font-weight: 700;
-            margin-bottom: 6px;
-        }
-        .chip {
-            display: inline-flex;
-            align-items: center;
-            gap: 6px;
-            padding: 6px 11px;
-            border-radius: 999px;
-            background: #eff6ff;
-            border: 1px solid #bfdbfe;
-            color: #1d4ed8;
-            font-size: 0.92rem;
-            margin: 7px 7px 0 0;
-        }
-        .callout {
-            border-left: 4px solid var(--accent);
-            background: #f1f5ff;
-            padding: 12px 14px;
-            border-radius: 12px;
-            color: var(--text);
-            margin: 12px 0 2px;
-            box-shadow: 0 6px 16px rgba(37, 99, 235, 0.08);
-        }
-        .section-intro {
-            margin: 0.25rem 0 0.85rem;
-        }
-        .section-intro h2 {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            margin-bottom: 4px;
-        }
-        .card {
-            border: 1px solid var(--border);
-            border-radius: 14px;
-            padding: 15px 16px;
-            background: rgba(255,255,255,0.95);
-            box-shadow: 0 8px 18px rgba(15, 23, 42, 0.04);
-            height: 100%;
-        }
-        .card-title {
-            font-weight: 750;
-            color: var(--text);
-            margin-bottom: 6px;
-        }
-        .card-desc {
-            color: var(--muted);
-            line-height: 1.6;
-        }
-        .card p:last-child,
-        .card ul:last-child {
-            margin-bottom: 0;
-        }
-        .card ul {
-            padding-left: 1.1rem;
-        }
-        .card li + li {
-            margin-top: 0.28rem;
-        }
-        .compare-card {
-            border: 1px solid var(--border);
-            border-radius: 20px;
-            padding: 18px 18px;
-            background: linear-gradient(180deg, rgba(255,255,255,0.98), rgba(248,250,252,0.96));
-            box-shadow: 0 10px 22px rgba(15, 23, 42, 0.05);
-            height: 100%;
-        }
-        .compare-card-eu {
-            border-color: rgba(196, 181, 253, 0.95);
-            background:
-                radial-gradient(circle at top right, rgba(124,58,237,0.10), transparent 36%),
-                linear-gradient(180deg, rgba(255,255,255,0.98), rgba(250,245,255,0.96));
-        }
-        .compare-kicker {
-            color: #64748b;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            font-size: 0.72rem;
-            font-weight: 800;
-            margin-bottom: 0.45rem;
-        }
-        .compare-card-eu .compare-kicker {
-            color: #7c3aed;
-        }
-        .compare-title {
-            color: var(--text);
-            font-size: 1.08rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.75rem;
-        }
-        .compare-list {
-            display: grid;
-            gap: 0.7rem;
-        }
-        .compare-item {
-            display: flex;
-            align-items: flex-start;
-            gap: 0.7rem;
-        }
-        .compare-dot {
-            width: 10px;
-            height: 10px;
-            border-radius: 999px;
-            flex-shrink: 0;
-            margin-top: 0.38rem;
-            background: #2563eb;
-        }
-        .compare-card-eu .compare-dot {
-            background: #7c3aed;
-        }
-        .compare-copy {
-            color: #475569;
-            line-height: 1.65;
-        }
-        .requirement-card {
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            border-radius: 18px;
-            padding: 14px 14px;
-            background: rgba(255,255,255,0.96);
-            box-shadow: 0 8px 18px rgba(15, 23, 42, 0.04);
-            height: 100%;
-        }
-        .requirement-number {
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            min-width: 30px;
-            height: 30px;
-            padding: 0 0.45rem;
-            border-radius: 999px;
-            background: rgba(124, 58, 237, 0.10);
-            color: #7c3aed;
-            font-size: 0.78rem;
-            font-weight: 800;
-            margin-bottom: 0.65rem;
-        }
-        .requirement-title {
-            color: var(--text);
-            font-size: 1rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.4rem;
-        }
-        .requirement-copy {
-            color: #64748b;
-            line-height: 1.6;
-            font-size: 0.93rem;
-        }
-        .section-note {
-            border-left: 3px solid #c4b5fd;
-            padding: 0.1rem 0 0.1rem 0.9rem;
-            color: #475569;
-            line-height: 1.65;
-            margin-top: 0.8rem;
-        }
-        .impact-card {
-            border: 1px solid var(--border);
-            border-radius: 20px;
-            padding: 18px 18px;
-            background: linear-gradient(180deg, rgba(255,255,255,0.98), rgba(248,250,252,0.96));
-            box-shadow: 0 10px 22px rgba(15, 23, 42, 0.05);
-            height: 100%;
-        }
-        .impact-card-kicker {
-            color: #64748b;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            font-size: 0.72rem;
-            font-weight: 800;
-            margin-bottom: 0.45rem;
-        }
-        .impact-card-title {
-            color: var(--text);
-            font-size: 1.1rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.55rem;
-        }
-        .impact-card-copy {
-            color: #475569;
-            line-height: 1.7;
-        }
-        .risk-chain {
-            display: grid;
-            gap: 0.75rem;
-        }
-        .risk-chain-item {
-            display: grid;
-            grid-template-columns: 34px 1fr;
-            gap: 0.8rem;
-            align-items: start;
-            padding: 0.8rem 0.9rem;
-            border-radius: 18px;
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            background: rgba(255,255,255,0.94);
-        }
-        .risk-chain-number {
-            width: 34px;
-            height: 34px;
-            border-radius: 999px;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            background: rgba(234, 88, 12, 0.12);
-            color: #c2410c;
-            font-size: 0.82rem;
-            font-weight: 800;
-        }
-        .risk-chain-title {
-            color: var(--text);
-            font-size: 0.98rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.24rem;
-        }
-        .risk-chain-copy {
-            color: #64748b;
-            line-height: 1.6;
-            font-size: 0.94rem;
-        }
-        .fine-tier-grid {
-            display: grid;
-            gap: 0.8rem;
-        }
-        .fine-tier {
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            border-radius: 18px;
-            padding: 13px 14px;
-            background: rgba(255,255,255,0.95);
-            box-shadow: 0 8px 18px rgba(15, 23, 42, 0.04);
-        }
-        .fine-tier-top {
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            gap: 10px;
-            margin-bottom: 0.45rem;
-        }
-        .fine-tier-title {
-            color: var(--text);
-            font-size: 0.98rem;
-            font-weight: 800;
-            line-height: 1.35;
-        }
-        .fine-tier-value {
-            display: inline-flex;
-            align-items: center;
-            border-radius: 999px;
-            padding: 0.24rem 0.62rem;
-            background: rgba(254, 226, 226, 0.92);
-            border: 1px solid rgba(252, 165, 165, 0.9);
-            color: #991b1b;
-            font-size: 0.76rem;
-            font-weight: 800;
-            white-space: nowrap;
-        }
-        .fine-tier-copy {
-            color: #64748b;
-            line-height: 1.6;
-            font-size: 0.93rem;
-        }
-        .fine-note {
-            border-left: 3px solid #f59e0b;
-            padding: 0.1rem 0 0.1rem 0.9rem;
-            color: #475569;
-            line-height: 1.65;
-            margin-top: 0.8rem;
-        }
-        .checklist-grid {
-            display: grid;
-            gap: 0.8rem;
-        }
-        .checklist-item {
-            display: grid;
-            grid-template-columns: 36px 1fr;
-            gap: 0.85rem;
-            align-items: start;
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            border-radius: 18px;
-            padding: 0.9rem 1rem;
-            background: rgba(255,255,255,0.95);
-            box-shadow: 0 8px 18px rgba(15, 23, 42, 0.04);
-        }
-        .checklist-number {
-            width: 36px;
-            height: 36px;
-            border-radius: 999px;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            background: rgba(37, 99, 235, 0.1);
-            color: #1d4ed8;
-            font-size: 0.84rem;
-            font-weight: 800;
-        }
-        .checklist-title {
-            color: var(--text);
-            font-size: 0.98rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.24rem;
-        }
-        .checklist-copy {
-            color: #64748b;
-            line-height: 1.6;
-            font-size: 0.94rem;
-        }
-        .risk-tier {
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            border-radius: 20px;
-            padding: 16px 16px;
-            background: rgba(255,255,255,0.96);
-            box-shadow: 0 10px 22px rgba(15, 23, 42, 0.05);
-            height: 100%;
-        }
-        .risk-tier-badge {
-            display: inline-flex;
-            align-items: center;
-            border-radius: 999px;
-            padding: 0.28rem 0.72rem;
-            font-size: 0.76rem;
-            font-weight: 800;
-            letter-spacing: 0.04em;
-            margin-bottom: 0.7rem;
-        }
-        .risk-tier-red {
-            background: rgba(254, 226, 226, 0.96);
-            color: #991b1b;
-            border: 1px solid rgba(252, 165, 165, 0.9);
-        }
-        .risk-tier-orange {
-            background: rgba(255, 237, 213, 0.96);
-            color: #9a3412;
-            border: 1px solid rgba(253, 186, 116, 0.92);
-        }
-        .risk-tier-yellow {
-            background: rgba(254, 249, 195, 0.96);
-            color: #854d0e;
-            border: 1px solid rgba(253, 224, 71, 0.9);
-        }
-        .risk-tier-green {
-            background: rgba(220, 252, 231, 0.96);
-            color: #166534;
-            border: 1px solid rgba(134, 239, 172, 0.9);
-        }
-        .risk-tier-title {
-            color: var(--text);
-            font-size: 1.05rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.45rem;
-        }
-        .risk-tier-copy {
-            color: #475569;
-            line-height: 1.65;
-            margin-bottom: 0.7rem;
-        }
-        .risk-tier ul {
-            margin: 0;
-            padding-left: 1.1rem;
-            color: #64748b;
-            line-height: 1.65;
-        }
-        .risk-ladder {
-            display: grid;
-            gap: 0.8rem;
-        }
-        .risk-ladder-item {
-            display: grid;
-            grid-template-columns: 40px 1fr;
-            gap: 0.9rem;
-            align-items: start;
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            border-radius: 18px;
-            padding: 0.9rem 1rem;
-            background: rgba(255,255,255,0.95);
-        }
-        .risk-ladder-number {
-            width: 40px;
-            height: 40px;
-            border-radius: 999px;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            background: rgba(124, 58, 237, 0.10);
-            color: #7c3aed;
-            font-size: 0.86rem;
-            font-weight: 800;
-        }
-        .risk-ladder-title {
-            color: var(--text);
-            font-size: 1rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.24rem;
-        }
-        .risk-ladder-copy {
-            color: #64748b;
-            line-height: 1.6;
-            font-size: 0.94rem;
-        }
-        .obligation-card {
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            border-radius: 18px;
-            padding: 14px 14px;
-            background: rgba(255,255,255,0.96);
-            box-shadow: 0 8px 18px rgba(15, 23, 42, 0.04);
-            height: 100%;
-        }
-        .obligation-title {
-            color: var(--text);
-            font-size: 1rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.35rem;
-        }
-        .obligation-copy {
-            color: #64748b;
-            line-height: 1.6;
-            font-size: 0.94rem;
-        }
-        .failure-story-card {
-            border: 1px solid rgba(203, 213, 225, 0.95);
-            border-radius: 22px;
-            padding: 18px 18px;
-            background: linear-gradient(180deg, rgba(255,255,255,0.98), rgba(248,250,252,0.96));
-            box-shadow: 0 12px 24px rgba(15, 23, 42, 0.05);
-            height: 100%;
-        }
-        .failure-story-kicker {
-            color: #64748b;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            font-size: 0.72rem;
-            font-weight: 800;
-            margin-bottom: 0.45rem;
-        }
-        .failure-story-title {
-            color: var(--text);
-            font-size: 1.08rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.65rem;
-        }
-        .failure-story-copy {
-            color: #475569;
-            line-height: 1.65;
-        }
-        .failure-panel {
-            border-radius: 18px;
-            padding: 12px 14px;
-            margin-top: 0.75rem;
-        }
-        .failure-panel-bad {
-            background: rgba(254, 242, 242, 0.96);
-            border: 1px solid rgba(252, 165, 165, 0.95);
-        }
-        .failure-panel-good {
-            background: rgba(240, 253, 244, 0.96);
-            border: 1px solid rgba(134, 239, 172, 0.95);
-        }
-        .failure-panel-title {
-            font-size: 0.94rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.3rem;
-        }
-        .failure-panel-bad .failure-panel-title {
-            color: #b91c1c;
-        }
-        .failure-panel-good .failure-panel-title {
-            color: #166534;
-        }
-        .failure-panel-copy {
-            color: #475569;
-            line-height: 1.6;
-            font-size: 0.94rem;
-        }
-        .failure-tag {
-            display: inline-flex;
-            align-items: center;
-            border-radius: 999px;
-            padding: 0.24rem 0.62rem;
-            font-size: 0.76rem;
-            font-weight: 800;
-            margin-right: 0.45rem;
-            margin-bottom: 0.45rem;
-            border: 1px solid rgba(203, 213, 225, 0.95);
-            background: rgba(255,255,255,0.92);
-            color: #334155;
-        }
-        .failure-lesson {
-            border-left: 3px solid #2563eb;
-            padding: 0.1rem 0 0.1rem 0.9rem;
-            color: #475569;
-            line-height: 1.65;
-            margin-top: 0.8rem;
-        }
-        .demo-case-card {
-            border: 1px solid rgba(203, 213, 225, 0.95);
-            border-radius: 22px;
-            padding: 18px 18px;
-            background: linear-gradient(180deg, rgba(255,255,255,0.98), rgba(248,250,252,0.96));
-            box-shadow: 0 12px 24px rgba(15, 23, 42, 0.05);
-            height: 100%;
-        }
-        .demo-case-kicker {
-            color: #64748b;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            font-size: 0.72rem;
-            font-weight: 800;
-            margin-bottom: 0.45rem;
-        }
-        .demo-case-title {
-            color: var(--text);
-            font-size: 1.1rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.45rem;
-        }
-        .demo-case-copy {
-            color: #475569;
-            line-height: 1.65;
-        }
-        .demo-signal-list {
-            display: grid;
-            gap: 0.65rem;
-        }
-        .demo-signal {
-            display: flex;
-            align-items: flex-start;
-            gap: 0.7rem;
-            padding: 0.7rem 0.8rem;
-            border-radius: 16px;
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            background: rgba(255,255,255,0.94);
-        }
-        .demo-signal-dot {
-            width: 10px;
-            height: 10px;
-            border-radius: 999px;
-            flex-shrink: 0;
-            margin-top: 0.38rem;
-            background: #2563eb;
-        }
-        .demo-signal-copy {
-            color: #475569;
-            line-height: 1.6;
-            font-size: 0.94rem;
-        }
-        .demo-outcome-card {
-            border: 1px solid rgba(203, 213, 225, 0.95);
-            border-radius: 22px;
-            padding: 18px 18px;
-            background: rgba(255,255,255,0.96);
-            box-shadow: 0 12px 26px rgba(15, 23, 42, 0.05);
-            height: 100%;
-        }
-        .demo-outcome-card-good {
-            border-color: rgba(134, 239, 172, 0.95);
-            background:
-                radial-gradient(circle at top right, rgba(34,197,94,0.10), transparent 34%),
-                linear-gradient(180deg, rgba(255,255,255,0.98), rgba(240,253,244,0.95));
-        }
-        .demo-outcome-card-risky {
-            border-color: rgba(253, 186, 116, 0.95);
-            background:
-                radial-gradient(circle at top right, rgba(245,158,11,0.10), transparent 34%),
-                linear-gradient(180deg, rgba(255,255,255,0.98), rgba(255,247,237,0.95));
-        }
-        .demo-outcome-kicker {
-            color: #64748b;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            font-size: 0.72rem;
-            font-weight: 800;
-            margin-bottom: 0.45rem;
-        }
-        .demo-outcome-title {
-            color: var(--text);
-            font-size: 1.15rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.55rem;
-        }
-        .demo-pill {
-            display: inline-flex;
-            align-items: center;
-            border-radius: 999px;
-            padding: 0.24rem 0.62rem;
-            font-size: 0.76rem;
-            font-weight: 800;
-            margin-bottom: 0.7rem;
-        }
-        .demo-pill-green {
-            background: rgba(220, 252, 231, 0.95);
-            color: #166534;
-            border: 1px solid rgba(134, 239, 172, 0.9);
-        }
-        .demo-pill-yellow {
-            background: rgba(254, 249, 195, 0.95);
-            color: #854d0e;
-            border: 1px solid rgba(253, 224, 71, 0.9);
-        }
-        .demo-pill-red {
-            background: rgba(254, 226, 226, 0.95);
-            color: #991b1b;
-            border: 1px solid rgba(252, 165, 165, 0.9);
-        }
-        .demo-outcome-copy {
-            color: #475569;
-            line-height: 1.65;
-            margin-bottom: 0.7rem;
-        }
-        .demo-reason-list {
-            display: grid;
-            gap: 0.5rem;
-        }
-        .demo-reason {
-            border-radius: 14px;
-            padding: 0.65rem 0.75rem;
-            background: rgba(255,255,255,0.9);
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            color: #475569;
-            line-height: 1.55;
-            font-size: 0.93rem;
-        }
-        .demo-note {
-            border-left: 3px solid #0f766e;
-            padding: 0.1rem 0 0.1rem 0.9rem;
-            color: #475569;
-            line-height: 1.65;
-        }
-        .framework-panel {
-            border: 1px solid rgba(203, 213, 225, 0.95);
-            border-radius: 22px;
-            padding: 18px 18px;
-            background:
-                radial-gradient(circle at top right, rgba(37,99,235,0.08), transparent 34%),
-                linear-gradient(180deg, rgba(255,255,255,0.98), rgba(248,250,252,0.96));
-            box-shadow: 0 12px 26px rgba(15, 23, 42, 0.05);
-        }
-        .framework-kicker {
-            color: #64748b;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            font-size: 0.72rem;
-            font-weight: 800;
-            margin-bottom: 0.45rem;
-        }
-        .framework-title {
-            color: var(--text);
-            font-size: 1.18rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.45rem;
-        }
-        .framework-summary {
-            color: #475569;
-            line-height: 1.7;
-            margin-bottom: 1rem;
-        }
-        .framework-meta-grid {
-            display: grid;
-            grid-template-columns: repeat(3, minmax(0, 1fr));
-            gap: 10px;
-            margin-bottom: 1rem;
-        }
-        .framework-meta {
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            border-radius: 16px;
-            padding: 11px 12px;
-            background: rgba(255,255,255,0.92);
-        }
-        .framework-meta-label {
-            color: #64748b;
-            font-size: 0.72rem;
-            text-transform: uppercase;
-            letter-spacing: 0.07em;
-            font-weight: 800;
-            margin-bottom: 0.28rem;
-        }
-        .framework-meta-value {
-            color: var(--text);
-            font-size: 0.92rem;
-            font-weight: 700;
-            line-height: 1.45;
-        }
-        .framework-focus-grid {
-            display: grid;
-            gap: 0.65rem;
-        }
-        .framework-focus-item {
-            display: flex;
-            align-items: flex-start;
-            gap: 0.7rem;
-            padding: 0.7rem 0.8rem;
-            border-radius: 16px;
-            background: rgba(255,255,255,0.9);
-            border: 1px solid rgba(226, 232, 240, 0.95);
-        }
-        .framework-focus-dot {
-            width: 10px;
-            height: 10px;
-            border-radius: 999px;
-            flex-shrink: 0;
-            margin-top: 0.38rem;
-            background: #2563eb;
-        }
-        .framework-focus-copy {
-            color: #475569;
-            line-height: 1.6;
-            font-size: 0.94rem;
-        }
-        .home-hero-card {
-            border: 1px solid rgba(191, 219, 254, 0.9);
-            border-radius: 24px;
-            padding: 22px 24px;
-            background:
-                radial-gradient(circle at top right, rgba(37,99,235,0.12), transparent 34%),
-                linear-gradient(180deg, rgba(255,255,255,0.98), rgba(248,250,252,0.96));
-            box-shadow: 0 18px 38px rgba(15, 23, 42, 0.08);
-        }
-        .home-hero-kicker {
-            color: #1d4ed8;
-            text-transform: uppercase;
-            letter-spacing: 0.11em;
-            font-size: 0.74rem;
-            font-weight: 800;
-            margin-bottom: 0.9rem;
-        }
-        .home-hero-title-row {
-            display: flex;
-            align-items: flex-start;
-            gap: 16px;
-        }
-        .home-hero-mark {
-            width: 58px;
-            height: 58px;
-            border-radius: 18px;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            background: rgba(37, 99, 235, 0.10);
-            flex-shrink: 0;
-        }
-        .home-hero-title {
-            color: var(--text);
-            font-size: clamp(2.5rem, 4vw, 4.2rem);
-            font-weight: 850;
-            line-height: 0.98;
-            letter-spacing: -0.04em;
-            margin-bottom: 0.9rem;
-        }
-        .home-hero-copy {
-            color: #475569;
-            font-size: 1.08rem;
-            line-height: 1.7;
-            max-width: 46rem;
-        }
-        .home-chip-row {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.55rem;
-            margin-top: 1.2rem;
-        }
-        .home-side-card {
-            border: 1px solid rgba(191, 219, 254, 0.9);
-            border-radius: 22px;
-            padding: 18px 18px;
-            background: rgba(255,255,255,0.96);
-            box-shadow: 0 14px 28px rgba(15, 23, 42, 0.05);
-            margin-bottom: 0.8rem;
-        }
-        .home-side-label {
-            display: flex;
-            align-items: center;
-            gap: 0.45rem;
-            color: #1d4ed8;
-            font-size: 0.82rem;
-            font-weight: 800;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            margin-bottom: 0.55rem;
-        }
-        .home-side-title {
-            color: var(--text);
-            font-size: 1.2rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.55rem;
-        }
-        .home-side-copy {
-            color: #64748b;
-            line-height: 1.65;
-        }
-        .home-kpi-grid {
-            display: grid;
-            grid-template-columns: repeat(2, minmax(0, 1fr));
-            gap: 10px;
-            margin-top: 0.9rem;
-        }
-        .home-kpi {
-            border: 1px solid var(--border);
-            border-radius: 18px;
-            padding: 13px 13px;
-            background: rgba(255,255,255,0.96);
-            box-shadow: 0 10px 20px rgba(15, 23, 42, 0.04);
-        }
-        .home-kpi-value {
-            color: var(--text);
-            font-size: 1.55rem;
-            font-weight: 850;
-            line-height: 1;
-            margin-bottom: 0.35rem;
-        }
-        .home-kpi-label {
-            color: #64748b;
-            font-size: 0.86rem;
-            line-height: 1.45;
-        }
-        .home-act-card {
-            border: 1px solid var(--border);
-            border-radius: 22px;
-            padding: 16px 16px;
-            background: linear-gradient(180deg, rgba(255,255,255,0.98), rgba(248,250,252,0.95));
-            box-shadow: 0 12px 24px rgba(15, 23, 42, 0.05);
-            margin-bottom: 0.75rem;
-        }
-        .home-act-header {
-            display: flex;
-            align-items: flex-start;
-            gap: 14px;
-        }
-        .home-act-icon {
-            width: 48px;
-            height: 48px;
-            border-radius: 15px;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            flex-shrink: 0;
-        }
-        .home-act-title {
-            color: var(--text);
-            font-size: 1.18rem;
-            font-weight: 800;
-            line-height: 1.3;
-            margin-bottom: 0.35rem;
-        }
-        .home-act-copy {
-            color: #64748b;
-            line-height: 1.65;
-        }
-        .home-page-summary {
-            position: relative;
-            margin: 0 0 0.8rem 0.35rem;
-            padding: 0.1rem 0 0.1rem 1rem;
-        }
-        .home-page-summary::before {
-            content: "";
-            position: absolute;
-            left: 0;
-            top: 0.1rem;
-            bottom: 0.1rem;
-            width: 2px;
-            border-radius: 999px;
-            background: linear-gradient(180deg, #dbeafe 0%, #e2e8f0 100%);
-        }
-        .home-page-title {
-            display: flex;
-            align-items: center;
-            gap: 0.55rem;
-            color: var(--text);
-            font-size: 1rem;
-            font-weight: 750;
-            margin-bottom: 0.3rem;
-        }
-        .home-page-dot {
-            width: 9px;
-            height: 9px;
-            border-radius: 999px;
-            flex-shrink: 0;
-        }
-        .home-page-copy {
-            color: #64748b;
-            line-height: 1.6;
-            font-size: 0.95rem;
-        }
-        .trust-compass-panel {
-            border: 1px solid rgba(191, 219, 254, 0.95);
-            border-radius: 24px;
-            padding: 18px 18px;
-            background:
-                radial-gradient(circle at top right, rgba(15,118,110,0.10), transparent 32%),
-                linear-gradient(180deg, rgba(255,255,255,0.98), rgba(248,250,252,0.96));
-            box-shadow: 0 16px 32px rgba(15, 23, 42, 0.06);
-            margin-bottom: 1rem;
-        }
-        .trust-compass-visual {
-            position: relative;
-            min-height: 360px;
-            border: 1px solid rgba(203, 213, 225, 0.9);
-            border-radius: 24px;
-            background: rgba(255,255,255,0.92);
-            overflow: hidden;
-            margin-bottom: 1rem;
-        }
-        .trust-compass-ring {
-            position: absolute;
-            inset: 50% auto auto 50%;
-            width: 250px;
-            height: 250px;
-            transform: translate(-50%, -50%);
-            border: 1.5px solid rgba(148, 163, 184, 0.35);
-            border-radius: 999px;
-            background: radial-gradient(circle, rgba(219, 234, 254, 0.26) 0%, rgba(219, 234, 254, 0.08) 54%, transparent 55%);
-        }
-        .trust-compass-ring-inner {
-            width: 150px;
-            height: 150px;
-            border-color: rgba(148, 163, 184, 0.22);
-            background: none;
-        }
-        .trust-compass-axis {
-            position: absolute;
-            left: 50%;
-            top: 50%;
-            background: rgba(148, 163, 184, 0.35);
-            transform: translate(-50%, -50%);
-        }
-        .trust-compass-axis-vertical {
-            width: 1px;
-            height: 238px;
-        }
-        .trust-compass-axis-horizontal {
-            width: 238px;
-            height: 1px;
-        }
-        .trust-compass-axis-diagonal-a {
-            width: 210px;
-            height: 1px;
-            transform: translate(-50%, -50%) rotate(45deg);
-        }
-        .trust-compass-axis-diagonal-b {
-            width: 210px;
-            height: 1px;
-            transform: translate(-50%, -50%) rotate(-45deg);
-        }
-        .trust-compass-cardinal {
-            position: absolute;
-            color: #64748b;
-            font-size: 0.76rem;
-            font-weight: 800;
-            letter-spacing: 0.12em;
-            text-transform: uppercase;
-        }
-        .trust-compass-cardinal-n {
-            top: 16px;
-            left: 50%;
-            transform: translateX(-50%);
-        }
-        .trust-compass-cardinal-e {
-            right: 18px;
-            top: 50%;
-            transform: translateY(-50%);
-        }
-        .trust-compass-cardinal-s {
-            bottom: 16px;
-            left: 50%;
-            transform: translateX(-50%);
-        }
-        .trust-compass-cardinal-w {
-            left: 18px;
-            top: 50%;
-            transform: translateY(-50%);
-        }
-        .trust-compass-needle {
-            position: absolute;
-            left: 50%;
-            top: 50%;
-            transform: translate(-50%, -50%);
-            width: 0;
-            height: 0;
-        }
-        .trust-compass-needle-main {
-            border-left: 12px solid transparent;
-            border-right: 12px solid transparent;
-            border-bottom: 88px solid #2563eb;
-            transform: translate(-50%, -92%);
-            filter: drop-shadow(0 10px 12px rgba(37, 99, 235, 0.18));
-        }
-        .trust-compass-needle-tail {
-            border-left: 9px solid transparent;
-            border-right: 9px solid transparent;
-            border-top: 62px solid rgba(148, 163, 184, 0.72);
-            transform: translate(-50%, -2%);
-        }
-        .trust-compass-hub {
-            position: absolute;
-            left: 50%;
-            top: 50%;
-            transform: translate(-50%, -50%);
-            width: 74px;
-            height: 74px;
-            border-radius: 999px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            background: rgba(255,255,255,0.98);
-            border: 1px solid rgba(191, 219, 254, 0.95);
-            box-shadow: 0 12px 24px rgba(15, 23, 42, 0.08);
-            color: var(--text);
-            font-size: 0.88rem;
-            font-weight: 800;
-        }
-        .trust-compass-point {
-            position: absolute;
-            display: inline-flex;
-            align-items: center;
-            gap: 0.45rem;
-            padding: 0.38rem 0.72rem;
-            border-radius: 999px;
-            background: rgba(255,255,255,0.96);
-            border: 1px solid rgba(203, 213, 225, 0.95);
-            color: var(--text);
-            font-size: 0.82rem;
-            font-weight: 750;
-            box-shadow: 0 10px 20px rgba(15, 23, 42, 0.05);
-        }
-        .trust-compass-point-north {
-            top: 46px;
-            left: 50%;
-            transform: translateX(-50%);
-        }
-        .trust-compass-point-east {
-            top: 50%;
-            right: 28px;
-            transform: translateY(-50%);
-        }
-        .trust-compass-point-south_east {
-            right: 64px;
-            bottom: 46px;
-        }
-        .trust-compass-point-south_west {
-            left: 64px;
-            bottom: 46px;
-        }
-        .trust-compass-point-west {
-            top: 50%;
-            left: 28px;
-            transform: translateY(-50%);
-        }
-        .trust-compass-point-dot {
-            width: 10px;
-            height: 10px;
-            border-radius: 999px;
-            flex-shrink: 0;
-        }
-        .trust-compass-caption {
-            margin-bottom: 1rem;
-            color: #475569;
-            line-height: 1.65;
-            font-size: 0.94rem;
-        }
-        .trust-compass-caption strong {
-            color: var(--text);
-        }
-        .trust-compass-legend {
-            display: grid;
-            gap: 0.8rem;
-        }
-        .trust-check-card {
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            border-radius: 18px;
-            padding: 12px 13px;
-            background: rgba(255,255,255,0.92);
-        }
-        .trust-check-title {
-            display: flex;
-            align-items: center;
-            gap: 0.55rem;
-            color: var(--text);
-            font-weight: 750;
-            margin-bottom: 0.45rem;
-        }
-        .trust-row-dot {
-            width: 10px;
-            height: 10px;
-            border-radius: 999px;
-            flex-shrink: 0;
-        }
-        .trust-check-question {
-            color: var(--text);
-            font-size: 0.96rem;
-            font-weight: 650;
-            line-height: 1.55;
-            margin-bottom: 0.35rem;
-        }
-        .trust-check-note {
-            color: #64748b;
-            font-size: 0.9rem;
-            line-height: 1.55;
-        }
-        .roadmap-stage-card {
-            border: 1px solid rgba(203, 213, 225, 0.95);
-            border-top: 4px solid var(--roadmap-accent);
-            border-radius: 24px;
-            padding: 18px 18px;
-            background:
-                radial-gradient(circle at top right, var(--roadmap-soft), transparent 36%),
-                linear-gradient(180deg, rgba(255,255,255,0.98), rgba(248,250,252,0.96));
-            box-shadow: 0 14px 28px rgba(15, 23, 42, 0.06);
-            height: 100%;
-        }
-        .roadmap-stage-top {
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            gap: 0.65rem;
-            margin-bottom: 0.85rem;
-        }
-        .roadmap-stage-step,
-        .roadmap-stage-window {
-            display: inline-flex;
-            align-items: center;
-            border-radius: 999px;
-            padding: 0.28rem 0.7rem;
-            font-size: 0.74rem;
-            font-weight: 800;
-            letter-spacing: 0.06em;
-            text-transform: uppercase;
-        }
-        .roadmap-stage-step {
-            background: rgba(15, 23, 42, 0.06);
-            color: var(--text);
-        }
-        .roadmap-stage-window {
-            background: rgba(255,255,255,0.92);
-            border: 1px solid rgba(203, 213, 225, 0.95);
-            color: #475569;
-        }
-        .roadmap-stage-head {
-            display: flex;
-            align-items: flex-start;
-            gap: 0.9rem;
-            margin-bottom: 0.95rem;
-        }
-        .roadmap-stage-icon {
-            width: 50px;
-            height: 50px;
-            border-radius: 16px;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            flex-shrink: 0;
-        }
-        .roadmap-stage-title {
-            color: var(--text);
-            font-size: 1.16rem;
-            font-weight: 800;
-            line-height: 1.3;
-            margin-bottom: 0.35rem;
-        }
-        .roadmap-stage-copy {
-            color: #64748b;
-            line-height: 1.65;
-        }
-        .roadmap-stage-meta {
-            display: flex;
-            justify-content: space-between;
-            gap: 0.8rem;
-            border-radius: 16px;
-            padding: 0.75rem 0.85rem;
-            background: rgba(255,255,255,0.82);
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            margin-bottom: 0.9rem;
-        }
-        .roadmap-stage-meta-label {
-            color: #64748b;
-            font-size: 0.76rem;
-            font-weight: 800;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-        }
-        .roadmap-stage-meta-value {
-            color: var(--text);
-            font-size: 0.92rem;
-            font-weight: 700;
-            text-align: right;
-        }
-        .roadmap-stage-list-label {
-            color: #475569;
-            font-size: 0.78rem;
-            font-weight: 800;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-            margin-bottom: 0.55rem;
-        }
-        .roadmap-stage-list {
-            margin: 0;
-            padding-left: 1.1rem;
-            color: #475569;
-            line-height: 1.7;
-        }
-        .roadmap-stage-list li + li {
-            margin-top: 0.32rem;
-        }
-        .roadmap-stage-gate {
-            margin-top: 0.95rem;
-            border-left: 3px solid var(--roadmap-accent);
-            padding: 0.1rem 0 0.1rem 0.85rem;
-            color: #475569;
-            line-height: 1.62;
-        }
-        .roadmap-checklist {
-            display: grid;
-            gap: 0.8rem;
-        }
-        .roadmap-check-item {
-            display: grid;
-            grid-template-columns: 38px 1fr;
-            gap: 0.9rem;
-            align-items: start;
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            border-radius: 18px;
-            padding: 0.95rem 1rem;
-            background: rgba(255,255,255,0.95);
-            box-shadow: 0 10px 20px rgba(15, 23, 42, 0.04);
-        }
-        .roadmap-check-number {
-            width: 38px;
-            height: 38px;
-            border-radius: 999px;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            background: rgba(37, 99, 235, 0.10);
-            color: #1d4ed8;
-            font-size: 0.84rem;
-            font-weight: 800;
-        }
-        .roadmap-check-title {
-            color: var(--text);
-            font-size: 0.98rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.24rem;
-        }
-        .roadmap-check-copy {
-            color: #64748b;
-            line-height: 1.6;
-            font-size: 0.94rem;
-        }
-        .roadmap-owner-card {
-            border: 1px solid rgba(226, 232, 240, 0.95);
-            border-radius: 20px;
-            padding: 16px 16px;
-            background:
-                radial-gradient(circle at top right, rgba(15,118,110,0.08), transparent 32%),
-                linear-gradient(180deg, rgba(255,255,255,0.98), rgba(248,250,252,0.96));
-            box-shadow: 0 12px 24px rgba(15, 23, 42, 0.05);
-            height: 100%;
-        }
-        .roadmap-owner-title {
-            color: var(--text);
-            font-size: 1rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.4rem;
-        }
-        .roadmap-owner-copy {
-            color: #475569;
-            line-height: 1.65;
-            font-size: 0.94rem;
-        }
-        .roadmap-priority-card {
-            border: 1px solid rgba(203, 213, 225, 0.95);
-            border-radius: 20px;
-            padding: 16px 16px;
-            background: rgba(255,255,255,0.96);
-            box-shadow: 0 12px 24px rgba(15, 23, 42, 0.05);
-            height: 100%;
-        }
-        .roadmap-priority-kicker {
-            color: #64748b;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            font-size: 0.72rem;
-            font-weight: 800;
-            margin-bottom: 0.45rem;
-        }
-        .roadmap-priority-title {
-            color: var(--text);
-            font-size: 1.04rem;
-            font-weight: 800;
-            line-height: 1.35;
-            margin-bottom: 0.45rem;
-        }
-        .roadmap-priority-copy {
-            color: #475569;
-            line-height: 1.65;
-        }
-        .roadmap-summary {
-            border: 1px solid rgba(196, 181, 253, 0.95);
-            border-radius: 24px;
-            padding: 22px 22px;
-            background:
-                radial-gradient(circle at top right, rgba(147,51,234,0.12), transparent 34%),
-                linear-gradient(180deg, rgba(255,255,255,0.98), rgba(250,245,255,0.96));
-            box-shadow: 0 16px 32px rgba(15, 23, 42, 0.06);
-        }
-        .roadmap-summary-kicker {
-            color: #7c3aed;
-            text-transform: uppercase;
-            letter-spacing: 0.1em;
-            font-size: 0.74rem;
-            font-weight: 800;
-            margin-bottom: 0.55rem;
-        }
-        .roadmap-summary-title {
-            color: var(--text);
-            font-size: 1.45rem;
-            font-weight: 850;
-            line-height: 1.2;
-            margin-bottom: 0.7rem;
-        }
-        .roadmap-summary-copy {
-            color: #475569;
-            line-height: 1.7;
-            font-size: 1rem;
-            margin-bottom: 1rem;
-        }
-        .roadmap-summary-chip-row {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.55rem;
-        }
-        .roadmap-summary-chip {
-            display: inline-flex;
-            align-items: center;
-            gap: 0.4rem;
-            border-radius: 999px;
-            padding: 0.38rem 0.78rem;
-            background: rgba(255,255,255,0.92);
-            border: 1px solid rgba(196, 181, 253, 0.95);
-            color: #5b21b6;
-            font-size: 0.82rem;
-            font-weight: 700;
-        }
-        .story-card {
-            border: 1px solid var(--border);
-            border-radius: 18px;
-            padding: 16px 16px 14px;
-            background: linear-gradient(180deg, rgba(255,255,255,0.98), rgba(248,250,252,0.96));
-            box-shadow: 0 10px 22px rgba(15, 23, 42, 0.05);
-            min-height: 190px;
-        }
-        .story-step {
-            display: inline-flex;
-            align-items: center;
-            border-radius: 999px;
-            padding: 0.25rem 0.65rem;
-            background: rgba(226, 232, 240, 0.85);
-            color: #334155;
-            font-size: 0.72rem;
-            font-weight: 800;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-            margin-bottom: 0.85rem;
-        }
-        .story-card-head {
-            display: flex;
-            align-items: flex-start;
-            gap: 12px;
-        }
-        .story-card-icon {
-            width: 46px;
-            height: 46px;
-            border-radius: 14px;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            flex-shrink: 0;
-        }
-        .story-card-title {
-            color: var(--text);
-            font-size: 1.22rem;
-            font-weight: 800;
-            line-height: 1.3;
-            margin-bottom: 0.45rem;
-        }
-        .story-card-desc {
-            color: var(--muted);
-            line-height: 1.65;
-        }
-        .home-stat-grid {
-            display: grid;
-            grid-template-columns: repeat(3, minmax(0, 1fr));
-            gap: 10px;
-            margin-bottom: 1rem;
-        }
-        .home-stat {
-            border: 1px solid var(--border);
-            border-radius: 16px;
-            padding: 12px 12px;
-            background: rgba(255,255,255,0.96);
-            box-shadow: 0 8px 18px rgba(15, 23, 42, 0.04);
-        }
-        .home-stat-value {
-            color: var(--text);
-            font-size: 1.5rem;
-            font-weight: 800;
-            line-height: 1;
-            margin-bottom: 0.3rem;
-        }
-        .home-stat-label {
-            color: var(--muted);
-            font-size: 0.84rem;
-            line-height: 1.45;
-        }
-        .home-bullet-list {
-            margin: 0;
-            padding-left: 1.1rem;
-            color: var(--muted);
-            line-height: 1.7;
-        }
-        .sidebar-hero,
-        .sidebar-note {
-            background: rgba(255,255,255,0.92);
-            border: 1px solid rgba(191, 219, 254, 0.9);
-            border-radius: 18px;
-            padding: 14px 14px;
-            margin-bottom: 12px;
-            box-shadow: 0 14px 30px rgba(37, 99, 235, 0.08);
-        }
-        .sidebar-hero {
-            background:
-                linear-gradient(180deg, rgba(255,255,255,0.98), rgba(239,246,255,0.96)),
-                radial-gradient(circle at top right, rgba(37,99,235,0.16), transparent 36%);
-        }
-        .sidebar-eyebrow {
-            color: #1d4ed8;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            font-size: 0.72rem;
-            font-weight: 800;
-            margin-bottom: 0.35rem;
-        }
-        .sidebar-title {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            font-weight: 750;
-            color: var(--text);
-            margin-bottom: 6px;
-        }
-        .sidebar-copy {
-            color: var(--muted);
-            font-size: 0.92rem;
-            line-height: 1.5;
-        }
-        .sidebar-progress-row {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.45rem;
-            margin-top: 0.85rem;
-        }
-        .sidebar-pill {
-            display: inline-flex;
-            align-items: center;
-            border-radius: 999px;
-            padding: 0.24rem 0.62rem;
-            background: rgba(219, 234, 254, 0.9);
-            color: #1d4ed8;
-            font-size: 0.74rem;
-            font-weight: 700;
-        }
-        .sidebar-pill-muted {
-            background: rgba(241, 245, 249, 0.95);
-            color: #334155;
-        }
-        .sidebar-progress-track {
-            width: 100%;
-            height: 8px;
-            border-radius: 999px;
-            margin-top: 0.8rem;
-            background: rgba(191, 219, 254, 0.45);
-            overflow: hidden;
-        }
-        .sidebar-progress-track span {
-            display: block;
-            height: 100%;
-            border-radius: inherit;
-            background: linear-gradient(90deg, #2563eb 0%, #0f766e 100%);
-        }
-        .sidebar-group-label {
-            color: #475569;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            font-size: 0.7rem;
-            font-weight: 800;
-            margin: 1rem 0 0.45rem;
-        }
-        .sidebar-link-meta {
-            margin: -0.18rem 0 0.7rem 0;
-            padding: 0 0.25rem 0 0.3rem;
-            color: #64748b;
-            font-size: 0.82rem;
-            line-height: 1.45;
-        }
-        .sidebar-link-meta-active {
-            color: #0f172a;
-        }
-        .sidebar-link-meta-next {
-            color: #334155;
-        }
-        .sidebar-link-kicker {
-            display: inline-block;
-            font-weight: 700;
-            color: #1d4ed8;
-            margin-right: 0.35rem;
-        }
-        .sidebar-note {
-            margin-top: 0.8rem;
-            color: var(--muted);
-        }
-        .sidebar-note-title {
-            display: flex;
-            align-items: center;
-            gap: 0.45rem;
-            font-weight: 750;
-            color: var(--text);
-            margin-bottom: 0.35rem;
-        }
-        .sidebar-note-copy {
-            font-weight: 700;
-            color: var(--text);
-        }
-        .sidebar-note-subcopy {
-            margin-top: 0.35rem;
-            font-size: 0.86rem;
-            line-height: 1.5;
-            color: #64748b;
-        }
-        .surface-strip {
-            border: 1px solid var(--border);
-            background: rgba(255,255,255,0.92);
-            border-radius: 14px;
-            padding: 14px 18px;
-            box-shadow: 0 10px 24px rgba(15, 23, 42, 0.04);
-        }
-        [data-testid="stMain"] [data-testid="stPageLink"] {
-            margin-top: 0.5rem;
-            margin-bottom: 0.75rem;
-        }
-        [data-testid="stMain"] [data-testid="stPageLink"] a {
-            display: inline-flex;
-            align-items: center;
-            gap: 0.35rem;
-            width: 100%;
-            min-height: 2rem;
-            justify-content: center;
-            padding: 0.5rem 0.8rem;
-            border: 1px solid var(--border);
-            border-radius: 10px;
-            background: #eef2ff;
-            color: #1d4ed8;
-            font-weight: 600;
-            box-shadow: none;
-        }
-        [data-testid="stMain"] [data-testid="stPageLink"] a:hover {
-            border-color: #bfdbfe;
-            background: #e0e7ff;
-            color: #1d4ed8;
-        }
-        [data-testid="stSidebar"] [data-testid="stPageLink"] {
-            margin-top: 0;
-            margin-bottom: 0.2rem;
-        }
-        [data-testid="stSidebar"] [data-testid="stPageLink"] a {
-            border-radius: 14px;
-            background: rgba(255,255,255,0.95);
-            border: 1px solid rgba(203, 213, 225, 0.95);
-            padding: 0.75rem 0.78rem;
-            width: 100%;
-            justify-content: flex-start;
-            font-weight: 650;
-            color: #0f172a;
-            box-shadow: 0 8px 18px rgba(15, 23, 42, 0.04);
-            transition: transform 140ms ease, border-color 140ms ease, box-shadow 140ms ease, background 140ms ease;
-        }
-        [data-testid="stSidebar"] [data-testid="stPageLink"] a:hover {
-            transform: translateY(-1px);
-            border-color: #93c5fd;
-            background: linear-gradient(180deg, #ffffff 0%, #eff6ff 100%);
-            box-shadow: 0 12px 22px rgba(37, 99, 235, 0.08);
-        }
-        [data-testid="stSidebar"] [data-testid="stPageLink"] a[aria-current="page"] {
-            border-color: #60a5fa;
-            background: linear-gradient(180deg, #eff6ff 0%, #dbeafe 100%);
-            color: #1d4ed8;
-            box-shadow: 0 12px 24px rgba(37, 99, 235, 0.14);
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    _inject_stylesheet("app.css")
 
 
 def setup_page(page_key: str, page_title: str, layout: str = "wide") -> None:
@@ -1983,209 +396,117 @@ def apply_dark_theme() -> None:
     inject_global_styles()
 
 
-@dataclass
-class Safeguards:
-    """
-    Safeguards are the *policy knobs* that make AI safer for real-world use.
-    """
-    data_quality_checks: bool = True
-    bias_check: bool = True
-    confidence_threshold_on: bool = True
-    human_review_low_conf: bool = True
-
-    # Policy thresholds (interactive)
-    conf_threshold: float = 0.65            # below => low confidence
-    missing_threshold: float = 0.10         # above => quality issue
-    max_data_age_days: int = 60             # above => stale data
-    ood_threshold: float = 0.45             # above => out-of-context
-
+# Layout shared by the mini-demo charts; each builder only adds its own axes.
+CHART_LAYOUT = {
+    "paper_bgcolor": "rgba(255,255,255,0)",
+    "plot_bgcolor": "rgba(255,255,255,0)",
+    "font": {"color": "#334155"},
+    "margin": {"l": 10, "r": 10, "t": 20, "b": 10},
+}
 
-def sigmoid(x: np.ndarray) -> np.ndarray:
-    return 1 / (1 + np.exp(-x))
+# The chart builders below are cached on exactly the values each chart
+# shows, so a rerun that does not change them skips building the figure.
+# Streamlit still serializes and sends it; only st.fragment keeps a chart
+# out of reruns it is not part of. Figures are shared between sessions:
+# pass them to st.plotly_chart as is.
 
 
-def simulate_model_outputs(df: pd.DataFrame, seed: int = 7) -> pd.DataFrame:
+@lru_cache(maxsize=128)
+def risk_counts_figure(counts: tuple):
     """
-    Simulate a simple prediction + confidence based on case features.
-    Intentionally lightweight and transparent for demo purposes.
+    Grouped bar chart of cases per risk level. `counts` holds (mode, level
+    counts) pairs, the counts in RISK_LEVELS order; empty levels are skipped.
     """
-    rng = np.random.default_rng(seed)
-
-    # Model score influenced by need (positive), data issues (negative), plus noise
-    x = (
-        2.4 * df["need_score"].to_numpy()
-        - 1.3 * df["missing_rate"].to_numpy()
-        - 1.0 * df["ood_score"].to_numpy()
-        - 0.004 * df["data_age_days"].to_numpy()
-        + rng.normal(0, 0.25, size=len(df))
+    import plotly.express as px
+
+    codes = np.tile(np.arange(len(RISK_LEVELS), dtype=np.int8), len(counts))
+    data = pd.DataFrame(
+        {
+            "risk_level": risk_level_categorical(codes),
+            "count": np.asarray([level_counts for _, level_counts in counts], dtype=np.int64).reshape(-1),
+            "mode": np.repeat([mode for mode, _ in counts], len(RISK_LEVELS)),
+        }
     )
-    prob = sigmoid(x)
-
-    # Confidence is lower when the case is out-of-context or has missing values
-    conf = np.clip(
-        0.92
-        - 0.55 * df["ood_score"].to_numpy()
-        - 0.85 * df["missing_rate"].to_numpy()
-        + rng.normal(0, 0.03, size=len(df)),
-        0.05,
-        0.99,
+    data = data[data["count"] > 0].sort_values(["mode", "risk_level"])
+    fig = px.bar(
+        data,
+        x="risk_level",
+        y="count",
+        color="mode",
+        barmode="group",
+        color_discrete_map={"Without safeguards": "#f59e0b", "With safeguards": "#0f766e"},
+        labels={"risk_level": "Risk level", "count": "Number of cases", "mode": ""},
     )
-
-    out = df.copy()
-    out["pred_prob"] = np.round(prob, 3)
-    out["pred_label"] = (prob >= 0.5).astype(int)
-    out["confidence"] = np.round(conf, 3)
-    return out
-
-
-def compute_bias_gap(df: pd.DataFrame) -> float:
-    """
-    Fairness proxy: difference in positive prediction rate between groups.
-    """
-    rates = df.groupby("sensitive_group")["pred_label"].mean()
-    if len(rates) < 2:
-        return 0.0
-    return float((rates.max() - rates.min()))
-
-
-def case_risk(row: pd.Series, s: Safeguards) -> Dict[str, Any]:
-    """
-    Human-friendly risk flags for a single case.
-    """
-    reasons = []
-    points = 0
-
-    # Data quality
-    if s.data_quality_checks:
-        if row["missing_rate"] > s.missing_threshold:
-            reasons.append("Data quality issue: too much missing information.")
-            points += 2
-        if row["data_age_days"] > s.max_data_age_days:
-            reasons.append("Data is old; the situation may have changed.")
-            points += 1
-    else:
-        reasons.append("No data quality checks enabled.")
-        points += 2
-
-    # Out-of-context (OOD)
-    if row["ood_score"] > s.ood_threshold:
-        reasons.append("Case looks unusual compared to training examples (out-of-context).")
-        points += 2
-
-    # Confidence threshold
-    low_conf = row["confidence"] < s.conf_threshold
-    if s.confidence_threshold_on:
-        if low_conf:
-            reasons.append("Low confidence prediction.")
-            points += 2
-    else:
-        reasons.append("No confidence threshold — AI may be used even when uncertain.")
-        points += 1
-
-    # Human review for low confidence
-    needs_review = False
-    if s.human_review_low_conf and low_conf:
-        needs_review = True
-        reasons.append("Human review required for low-confidence cases.")
-        # review reduces operational risk a bit
-        points = max(0, points - 1)
-
-    # Map points to traffic light
-    if points >= 5:
-        level = "RED"
-    elif points >= 3:
-        level = "YELLOW"
-    else:
-        level = "GREEN"
-
-    return {
-        "risk_level": level,
-        "risk_points": int(points),
-        "needs_review": bool(needs_review),
-        "low_conf": bool(low_conf),
-        "reasons": reasons if reasons else ["No major risk flags triggered."],
-    }
-
-
-def add_risk_columns(df: pd.DataFrame, s: Safeguards) -> pd.DataFrame:
-    """
-    Vector-friendly risk labels for dashboards.
-    """
-    out = df.copy()
-    # Flags
-    out["flag_quality"] = False
-    out["flag_stale"] = False
-    out["flag_ood"] = out["ood_score"] > s.ood_threshold
-    out["flag_low_conf"] = out["confidence"] < s.conf_threshold
-
-    if s.data_quality_checks:
-        out["flag_quality"] = out["missing_rate"] > s.missing_threshold
-        out["flag_stale"] = out["data_age_days"] > s.max_data_age_days
-    else:
-        # if checks are off, treat as "unknown/higher baseline"
-        out["flag_quality"] = True
-
-    # Risk points
-    pts = np.zeros(len(out), dtype=int)
-    pts += out["flag_quality"].astype(int) * 2
-    pts += out["flag_stale"].astype(int) * 1
-    pts += out["flag_ood"].astype(int) * 2
-
-    if s.confidence_threshold_on:
-        pts += out["flag_low_conf"].astype(int) * 2
-    else:
-        pts += 1  # baseline risk if threshold isn't used
-
-    # Human review reduces a point for low-confidence cases (when enabled)
-    out["needs_review"] = False
-    if s.human_review_low_conf:
-        out["needs_review"] = out["flag_low_conf"]
-        pts = np.where(out["needs_review"], np.maximum(0, pts - 1), pts)
-
-    out["risk_points"] = pts
-    out["risk_level"] = np.where(pts >= 5, "RED", np.where(pts >= 3, "YELLOW", "GREEN"))
-    return out
-
-
-def overall_summary(df: pd.DataFrame, s: Safeguards) -> Dict[str, Any]:
-    """
-    Management-friendly KPIs.
-    """
-    low_conf_rate = float((df["confidence"] < s.conf_threshold).mean())
-    ood_rate = float((df["ood_score"] > s.ood_threshold).mean())
-
-    quality_incident_rate: Optional[float] = None
-    if s.data_quality_checks:
-        quality_incident_rate = float(((df["missing_rate"] > s.missing_threshold) | (df["data_age_days"] > s.max_data_age_days)).mean())
-
-    bias_gap: Optional[float] = compute_bias_gap(df) if s.bias_check else None
-
-    # Risk index (0..1) - intentionally simple and explainable
-    risk_index = 0.0
-    risk_index += 0.45 * low_conf_rate
-    risk_index += 0.25 * ood_rate
-    if quality_incident_rate is not None:
-        risk_index += 0.20 * quality_incident_rate
-    else:
-        risk_index += 0.20 * 0.50  # assume higher baseline if not measured
-    if bias_gap is not None:
-        risk_index += 0.35 * bias_gap
-    else:
-        risk_index += 0.12
-
-    risk_index = float(np.clip(risk_index, 0, 1))
-    if risk_index >= 0.62:
-        overall = "RED"
-    elif risk_index >= 0.38:
-        overall = "YELLOW"
-    else:
-        overall = "GREEN"
-
-    return {
-        "overall_risk": overall,
-        "risk_index": round(risk_index, 3),
-        "low_conf_rate": round(low_conf_rate, 3),
-        "ood_rate": round(ood_rate, 3),
-        "quality_incident_rate": None if quality_incident_rate is None else round(quality_incident_rate, 3),
-        "bias_gap": None if bias_gap is None else round(float(bias_gap), 3),
-    }
+    fig.update_layout(
+        **CHART_LAYOUT,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
+        yaxis=dict(gridcolor="#e2e8f0"),
+    )
+    return fig
+
+
+@lru_cache(maxsize=128)
+def reliability_figure(probs: tuple):
+    """Line chart of the predicted probability over repeated runs."""
+    import plotly.express as px
+
+    data = pd.DataFrame({"Run": np.arange(1, len(probs) + 1), "Probability": np.asarray(probs)})
+    fig = px.line(data, x="Run", y="Probability", markers=True)
+    fig.add_hline(y=0.5, line_dash="dash", line_color="#64748b")
+    fig.update_layout(**CHART_LAYOUT, yaxis=dict(range=[0, 1], gridcolor="#e2e8f0"))
+    return fig
+
+
+@lru_cache(maxsize=128)
+def safe_zone_figure(
+    ood_score: float, confidence: float, case_id: str, ood_threshold: float, conf_threshold: float, flagged: bool
+):
+    """One case against the confidence / out-of-context thresholds."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_shape(type="rect", x0=0, y0=conf_threshold, x1=ood_threshold, y1=1, fillcolor="rgba(34,197,94,0.08)", line_width=0)
+    fig.add_shape(type="rect", x0=ood_threshold, y0=0, x1=1, y1=conf_threshold, fillcolor="rgba(239,68,68,0.10)", line_width=0)
+    fig.add_vline(x=ood_threshold, line_dash="dash", line_color="#f59e0b")
+    fig.add_hline(y=conf_threshold, line_dash="dash", line_color="#f59e0b")
+    fig.add_trace(
+        go.Scatter(
+            x=[ood_score],
+            y=[confidence],
+            mode="markers+text",
+            marker=dict(size=18, color="#ef4444" if flagged else "#16a34a", symbol="star"),
+            text=[case_id],
+            textposition="top center",
+            name="Selected case",
+        )
+    )
+    fig.update_layout(
+        **CHART_LAYOUT,
+        xaxis=dict(title="Out-of-context score", range=[0, 1], gridcolor="#e2e8f0"),
+        yaxis=dict(title="Confidence", range=[0, 1], gridcolor="#e2e8f0"),
+    )
+    return fig
+
+
+@lru_cache(maxsize=128)
+def fairness_figure(rates: tuple):
+    """Bar chart of the positive prediction rate per group; `rates` holds (group, rate) pairs."""
+    import plotly.express as px
+
+    data = pd.DataFrame(list(rates), columns=["sensitive_group", "positive_rate"])
+    fig = px.bar(
+        data,
+        x="sensitive_group",
+        y="positive_rate",
+        color="sensitive_group",
+        text=data["positive_rate"].apply(lambda v: f"{v:.0%}"),
+        color_discrete_sequence=["#3b82f6", "#a855f7"],
+    )
+    fig.update_traces(textposition="outside")
+    fig.update_layout(
+        **CHART_LAYOUT,
+        showlegend=False,
+        yaxis=dict(range=[0, 1.2], gridcolor="#e2e8f0", title="Positive rate"),
+        xaxis=dict(title=""),
+    )
+    return fig